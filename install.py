@@ -2,41 +2,174 @@ import os
 import sys
 import subprocess
 import json
-import platform
-import shutil
 import ctypes
+import importlib
+import locale
+import hashlib
+import py_compile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from importlib.metadata import distribution, PackageNotFoundError
+
+# Platform check (sys.platform is fixed at build time, no uname/subprocess)
+IS_WIN = sys.platform.startswith("win")
+
+# Installation folders, resolved once per run
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+
+# Packages the application needs at runtime
+REQUIRED_PACKAGES = [
+    "pandas",
+    "openpyxl",
+    "pillow",
+    "tkcalendar",
+    "pywin32",
+    "orjson",
+    "xlsxwriter"
+]
+
+# Prebuilt worker import template
+TEMPLATE_ASSET = os.path.join(BASE_DIR, "assets", "worker_template.xlsx")
+
+# Marker left by a completed install, so re-runs can skip all setup work
+INSTALLER_VERSION = "1.0"
+INSTALL_MARKER = os.path.join(BASE_DIR, ".installed")
+
+# User's desktop folder, resolved once per run
+DESKTOP = os.path.join(os.path.expanduser("~"), "Desktop")
+
+# Directories already created (or found) during this run
+created_dirs = set()
+
+# Launcher batch file; CRLF line endings as cmd.exe expects
+BATCH_TEMPLATE = (
+    b'@echo off\r\n'
+    b'echo Starting Workplace Scheduler...\r\n'
+    b'python "%b"\r\n'
+    b'if %%ERRORLEVEL%% neq 0 pause\r\n'
+)
+
+# Initial config for each workplace
+WORKPLACE_CONFIGS = {
+    "IT Service Center": {
+        "name": "IT Service Center",
+        "hours_of_operation": {
+            "Monday": "12:00 PM - 7:30 PM",
+            "Tuesday": "12:00 PM - 7:30 PM",
+            "Wednesday": "12:00 PM - 7:30 PM",
+            "Thursday": "12:00 PM - 7:30 PM",
+            "Friday": "11:00 AM - 4:00 PM",
+            "Saturday": "11:30 AM - 4:30 PM",
+            "Sunday": "11:30 AM - 4:30 PM"
+        },
+        "shift_times": {
+            "Monday": ["12:00 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM", 
+                       "12:00 PM - 2:00 PM", "2:00 PM - 5:00 PM", "5:00 PM - 8:00 PM"],
+            "Tuesday": ["12:30 PM - 3:00 PM", "3:00 PM - 8:00 PM",
+                        "12:00 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM"],
+            "Wednesday": ["12:00 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM",
+                          "12:00 PM - 5:00 PM", "5:00 PM - 8:00 PM"],
+            "Thursday": ["12:30 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM",
+                         "12:00 PM - 3:00 PM", "3:00 PM - 8:00 PM"],
+            "Friday": ["11:00 AM - 2:00 PM", "2:00 PM - 4:00 PM"],
+            "Saturday": ["12:00 PM - 5:00 PM", "12:00 PM - 5:00 PM"],
+            "Sunday": ["12:00 PM - 5:00 PM", "12:00 PM - 5:00 PM"]
+        }
+    },
+    "Esports Lounge (Shultz)": {
+        "name": "Esports Lounge (Shultz)",
+        "hours_of_operation": {
+            "Monday": "2:00 PM - 12:00 AM",
+            "Tuesday": "2:00 PM - 12:00 AM",
+            "Wednesday": "2:00 PM - 12:00 AM",
+            "Thursday": "2:00 PM - 12:00 AM",
+            "Friday": "2:00 PM - 12:00 AM",
+            "Saturday": "12:00 PM - 12:00 AM",
+            "Sunday": "12:00 PM - 12:00 AM"
+        },
+        "shift_times": {
+            "Monday": ["2:00 PM - 6:00 PM", "6:00 PM - 9:00 PM", "9:00 PM - 12:00 AM"],
+            "Tuesday": ["2:00 PM - 5:00 PM", "5:00 PM - 8:00 PM", "8:00 PM - 12:00 AM"],
+            "Wednesday": ["2:00 PM - 6:00 PM", "6:00 PM - 9:00 PM", "9:00 PM - 12:00 AM"],
+            "Thursday": ["2:00 PM - 4:00 PM", "4:00 PM - 8:00 PM", "8:00 PM - 12:00 AM"],
+            "Friday": ["2:00 PM - 7:00 PM", "7:00 PM - 9:00 PM", "9:00 PM - 12:00 AM"],
+            "Saturday": ["12:00 PM - 4:00 PM", "4:00 PM - 7:00 PM", "7:00 PM - 10:00 PM", "10:00 PM - 12:00 AM"],
+            "Sunday": ["12:00 PM - 4:00 PM", "4:00 PM - 8:00 PM", "8:00 PM - 12:00 AM"]
+        }
+    },
+    "Esports Lounge (Williams Center)": {
+        "name": "Esports Lounge (Williams Center)",
+        "hours_of_operation": {}
+    }
+}
+
+# JSON files written by the installer, serialized once at import
+CONFIG_BLOBS = {
+    name: json.dumps(config, indent=4).encode()
+    for name, config in WORKPLACE_CONFIGS.items()
+}
+EMPTY_WORKERS_BLOB = b"[]"
+SETTINGS_BLOB = json.dumps({"email": "admin@example.com"}, indent=4).encode()
+
+# Shell32 entry points, bound once with typed prototypes
+if IS_WIN:
+    shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+    IsUserAnAdmin = shell32.IsUserAnAdmin
+    IsUserAnAdmin.argtypes = []
+    IsUserAnAdmin.restype = ctypes.c_int
+    ShellExecuteW = shell32.ShellExecuteW
+    ShellExecuteW.argtypes = [
+        ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_wchar_p,
+        ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_int
+    ]
+    ShellExecuteW.restype = ctypes.c_void_p
 
 def is_admin():
     """Check if the script is running with admin privileges"""
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
+        return bool(IsUserAnAdmin())
     except:
         return False
 
-def run_as_admin():
+def run_as_admin(args=("--shortcut-only",)):
     """Re-run the script with admin privileges"""
-    ctypes.windll.shell32.ShellExecuteW(
-        None, "runas", sys.executable, " ".join(sys.argv), None, 1
-    )
+    params = subprocess.list2cmdline([os.path.abspath(__file__), *args])
+    ShellExecuteW(None, "runas", sys.executable, params, None, 1)
 
 def create_windows_shortcut(target_path, shortcut_name):
     """Create Windows desktop shortcut"""
+    if not IS_WIN:
+        return False
+    
+    # Skip the COM imports entirely when a previous run already made the shortcut
+    shortcut_path = os.path.join(DESKTOP, f"{shortcut_name}.lnk")
+    if os.path.exists(shortcut_path):
+        print(f"Desktop shortcut already exists at: {shortcut_path}")
+        return True
+    
     try:
-        import winshell
-        from win32com.client import Dispatch
+        import pythoncom
+        from win32com.shell import shell
         
-        # Get desktop path
-        desktop = winshell.desktop()
-        
-        # Create shortcut
-        shortcut_path = os.path.join(desktop, f"{shortcut_name}.lnk")
-        shell = Dispatch('WScript.Shell')
-        shortcut = shell.CreateShortCut(shortcut_path)
-        shortcut.Targetpath = target_path
-        shortcut.WorkingDirectory = os.path.dirname(target_path)
-        shortcut.IconLocation = sys.executable
-        shortcut.save()
+        # Create shortcut through IShellLink directly instead of the WScript.Shell host
+        pythoncom.CoInitialize()
+        try:
+            link = pythoncom.CoCreateInstance(
+                shell.CLSID_ShellLink, None,
+                pythoncom.CLSCTX_INPROC_SERVER, shell.IID_IShellLink
+            )
+            link.SetPath(target_path)
+            link.SetWorkingDirectory(os.path.dirname(target_path))
+            link.SetIconLocation(sys.executable, 0)
+            persist_file = link.QueryInterface(pythoncom.IID_IPersistFile)
+            persist_file.Save(shortcut_path, 0)
+            
+            # Release both interfaces while this thread's COM apartment still exists
+            del persist_file, link
+        finally:
+            pythoncom.CoUninitialize()
         
         print(f"Created desktop shortcut at: {shortcut_path}")
         return True
@@ -44,162 +177,186 @@ def create_windows_shortcut(target_path, shortcut_name):
         print(f"Error creating desktop shortcut: {e}")
         return False
 
-def create_windows_batch_file(script_path, name):
+def is_same_content(path, content):
+    """Check if a file already holds exactly these bytes"""
+    try:
+        # Compare sizes first so a changed file is usually caught without reading it
+        if path.stat().st_size != len(content):
+            return False
+        return path.read_bytes() == content
+    except OSError:
+        return False
+
+def create_windows_batch_file(script_path, name, base_dir=BASE_DIR):
     """Create a batch file to run the application"""
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    batch_path = os.path.join(base_dir, f"{name}.bat")
+    content = BATCH_TEMPLATE % script_path.encode(locale.getpreferredencoding(False))
     
-    try:
-        with open(batch_path, 'w') as f:
-            f.write(f'@echo off\n')
-            f.write(f'echo Starting Workplace Scheduler...\n')
-            f.write(f'python "{script_path}"\n')
-            f.write(f'if %ERRORLEVEL% neq 0 pause\n')
-        
-        # Also create a desktop batch file
-        desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-        desktop_batch = os.path.join(desktop, f"{name}.bat")
-        
+    # Write the same batch file to the application folder and the desktop
+    created = False
+    for label, target_dir in (("application", base_dir), ("desktop", DESKTOP)):
+        batch_path = os.path.join(target_dir, f"{name}.bat")
         try:
-            shutil.copy(batch_path, desktop_batch)
-            print(f"Created desktop batch file at: {desktop_batch}")
+            path = Path(batch_path)
+            if is_same_content(path, content):
+                print(f"{label.capitalize()} batch file is up to date at: {batch_path}")
+            else:
+                path.write_bytes(content)
+                print(f"Created {label} batch file at: {batch_path}")
+            created = True
         except Exception as e:
-            print(f"Could not create desktop batch file: {e}")
-        
-        print(f"Created application batch file at: {batch_path}")
+            print(f"Could not create {label} batch file: {e}")
+    
+    return created
+
+def install_stamp():
+    """Build the marker contents for this installer version and package list"""
+    deps_hash = hashlib.sha256(json.dumps(REQUIRED_PACKAGES).encode()).hexdigest()
+    return json.dumps({"version": INSTALLER_VERSION, "deps_hash": deps_hash}).encode()
+
+def is_install_current():
+    """Check if a previous install left a marker matching this installer"""
+    try:
+        return Path(INSTALL_MARKER).read_bytes() == install_stamp()
+    except OSError:
+        return False
+
+def is_installed(package):
+    """Check if a distribution is already installed"""
+    try:
+        distribution(package)
         return True
-    except Exception as e:
-        print(f"Warning: Could not create batch file: {e}")
+    except PackageNotFoundError:
         return False
 
+def run_pip(args):
+    """Run pip in this process when possible, otherwise in a subprocess"""
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        subprocess.check_call([sys.executable, "-m", "pip"] + args)
+        return
+    
+    status = pip_main(args)
+    # Let the import system see packages installed by this process
+    importlib.invalidate_caches()
+    if status:
+        raise subprocess.CalledProcessError(status, ["pip"] + args)
+
 def install_dependencies():
     """Install required Python packages"""
-    required_packages = [
-        "pandas",
-        "openpyxl",
-        "pillow",
-        "tkcalendar",
-        "pywin32",
-        "winshell"
-    ]
+    # Only hand pip the packages that are not installed yet
+    missing = [p for p in REQUIRED_PACKAGES if not is_installed(p)]
+    if not missing:
+        print("All required packages are already installed.")
+        return True
+    
+    pip_install = ["install", "--disable-pip-version-check", "--no-input",
+                   "--prefer-binary", "--quiet"]
+
+    # Keep downloaded wheels next to the app so reinstalls don't hit the network again
+    os.environ.setdefault("PIP_CACHE_DIR", os.path.join(BASE_DIR, ".pip-cache"))
     
     print("Installing required packages...")
-    for package in required_packages:
+    try:
+        # Install everything in one pip run (one interpreter start and resolver pass)
+        run_pip(pip_install + missing)
+        print(f"Successfully installed {', '.join(missing)}")
+        return True
+    except subprocess.CalledProcessError:
+        print("Batch install failed, retrying packages one at a time...")
+
+    # Fall back to one package at a time to find which one failed
+    all_installed = True
+    for package in missing:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            run_pip(pip_install + [package])
             print(f"Successfully installed {package}")
         except subprocess.CalledProcessError:
             print(f"Failed to install {package}. Please install it manually using: pip install {package}")
+            all_installed = False
+    
+    return all_installed
 
-def create_folder_structure():
-    """Create necessary folders for the application"""
-    base_dir = os.path.dirname(os.path.abspath(__file__))
+def make_dir(path):
+    """Create a single directory, ignoring EEXIST instead of probing first"""
+    if path in created_dirs:
+        return
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    created_dirs.add(path)
+
+def write_file(path, payload):
+    """Write bytes to a file, creating its folder only if the write finds it missing"""
+    try:
+        Path(path).write_bytes(payload)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Path(path).write_bytes(payload)
+
+def workplace_dirs(data_dir):
+    """List every folder the installer needs, parents before children"""
+    dirs = [data_dir]
+    for workplace in WORKPLACE_CONFIGS:
+        workplace_dir = os.path.join(data_dir, workplace)
+        dirs.append(workplace_dir)
+        dirs.append(os.path.join(workplace_dir, "workers"))
+        dirs.append(os.path.join(workplace_dir, "schedules"))
+    return dirs
+
+def init_workplace(data_dir, workplace):
+    """Write the starter files for one workplace"""
+    workplace_dir = os.path.join(data_dir, workplace)
     
-    # Create data directory
-    data_dir = os.path.join(base_dir, "data")
-    os.makedirs(data_dir, exist_ok=True)
+    # Create initial config file
+    write_file(os.path.join(workplace_dir, "config.json"), CONFIG_BLOBS[workplace])
     
-    # Create workplace directories
-    workplaces = [
-        "IT Service Center",
-        "Esports Lounge (Shultz)",
-        "Esports Lounge (Williams Center)"
-    ]
+    # Create empty workers.json file
+    write_file(os.path.join(workplace_dir, "workers", "workers.json"), EMPTY_WORKERS_BLOB)
+
+def create_folder_structure(data_dir=DATA_DIR):
+    """Create necessary folders for the application"""
+    # Create all directories in one ordered pass
+    for path in workplace_dirs(data_dir):
+        make_dir(path)
     
-    for workplace in workplaces:
-        workplace_dir = os.path.join(data_dir, workplace)
-        os.makedirs(workplace_dir, exist_ok=True)
-        
-        # Create subdirectories
-        os.makedirs(os.path.join(workplace_dir, "workers"), exist_ok=True)
-        os.makedirs(os.path.join(workplace_dir, "schedules"), exist_ok=True)
-        
-        # Create initial config file
-        config = {
-            "name": workplace,
-            "hours_of_operation": {}
-        }
-        
-        if workplace == "IT Service Center":
-            config["hours_of_operation"] = {
-                "Monday": "12:00 PM - 7:30 PM",
-                "Tuesday": "12:00 PM - 7:30 PM",
-                "Wednesday": "12:00 PM - 7:30 PM",
-                "Thursday": "12:00 PM - 7:30 PM",
-                "Friday": "11:00 AM - 4:00 PM",
-                "Saturday": "11:30 AM - 4:30 PM",
-                "Sunday": "11:30 AM - 4:30 PM"
-            }
-            config["shift_times"] = {
-                "Monday": ["12:00 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM", 
-                           "12:00 PM - 2:00 PM", "2:00 PM - 5:00 PM", "5:00 PM - 8:00 PM"],
-                "Tuesday": ["12:30 PM - 3:00 PM", "3:00 PM - 8:00 PM",
-                            "12:00 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM"],
-                "Wednesday": ["12:00 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM",
-                              "12:00 PM - 5:00 PM", "5:00 PM - 8:00 PM"],
-                "Thursday": ["12:30 PM - 3:00 PM", "3:00 PM - 6:00 PM", "6:00 PM - 8:00 PM",
-                             "12:00 PM - 3:00 PM", "3:00 PM - 8:00 PM"],
-                "Friday": ["11:00 AM - 2:00 PM", "2:00 PM - 4:00 PM"],
-                "Saturday": ["12:00 PM - 5:00 PM", "12:00 PM - 5:00 PM"],
-                "Sunday": ["12:00 PM - 5:00 PM", "12:00 PM - 5:00 PM"]
-            }
-        elif workplace == "Esports Lounge (Shultz)":
-            config["hours_of_operation"] = {
-                "Monday": "2:00 PM - 12:00 AM",
-                "Tuesday": "2:00 PM - 12:00 AM",
-                "Wednesday": "2:00 PM - 12:00 AM",
-                "Thursday": "2:00 PM - 12:00 AM",
-                "Friday": "2:00 PM - 12:00 AM",
-                "Saturday": "12:00 PM - 12:00 AM",
-                "Sunday": "12:00 PM - 12:00 AM"
-            }
-            config["shift_times"] = {
-                "Monday": ["2:00 PM - 6:00 PM", "6:00 PM - 9:00 PM", "9:00 PM - 12:00 AM"],
-                "Tuesday": ["2:00 PM - 5:00 PM", "5:00 PM - 8:00 PM", "8:00 PM - 12:00 AM"],
-                "Wednesday": ["2:00 PM - 6:00 PM", "6:00 PM - 9:00 PM", "9:00 PM - 12:00 AM"],
-                "Thursday": ["2:00 PM - 4:00 PM", "4:00 PM - 8:00 PM", "8:00 PM - 12:00 AM"],
-                "Friday": ["2:00 PM - 7:00 PM", "7:00 PM - 9:00 PM", "9:00 PM - 12:00 AM"],
-                "Saturday": ["12:00 PM - 4:00 PM", "4:00 PM - 7:00 PM", "7:00 PM - 10:00 PM", "10:00 PM - 12:00 AM"],
-                "Sunday": ["12:00 PM - 4:00 PM", "4:00 PM - 8:00 PM", "8:00 PM - 12:00 AM"]
-            }
-        
-        with open(os.path.join(workplace_dir, "config.json"), 'w') as f:
-            json.dump(config, f, indent=4)
-        
-        # Create empty workers.json file
-        with open(os.path.join(workplace_dir, "workers", "workers.json"), 'w') as f:
-            json.dump([], f, indent=4)
+    # Write workplace files (independent, so write them in parallel)
+    with ThreadPoolExecutor(max_workers=len(WORKPLACE_CONFIGS)) as executor:
+        list(executor.map(
+            lambda workplace: init_workplace(data_dir, workplace),
+            WORKPLACE_CONFIGS
+        ))
     
     # Create user settings file
-    user_settings = {
-        "email": "admin@example.com"
-    }
-    
-    with open(os.path.join(data_dir, "settings.json"), 'w') as f:
-        json.dump(user_settings, f, indent=4)
+    write_file(os.path.join(data_dir, "settings.json"), SETTINGS_BLOB)
     
     print(f"Created folder structure in {data_dir}")
 
-def create_template_excel():
+def create_template_excel(base_dir=BASE_DIR):
     """Create template Excel files for worker import"""
+    templates_dir = os.path.join(base_dir, "templates")
+    template_path = os.path.join(templates_dir, "worker_template.xlsx")
+    
+    # A single stat is much cheaper than importing openpyxl on re-runs
+    if os.path.exists(template_path):
+        print(f"Template Excel file already exists at {template_path}")
+        return
+    
+    os.makedirs(templates_dir, exist_ok=True)
+    
+    # The template is fixed data, so copy the prebuilt workbook when it ships with the app
     try:
-        import pandas as pd
-        
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        templates_dir = os.path.join(base_dir, "templates")
-        os.makedirs(templates_dir, exist_ok=True)
-        
-        # Create worker template
-        columns = [
-            "First Name", "Last Name", 
-            "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday",
-            "Day(s) & Time not Available", "Day(s) & Time not Available", 
-            "Email", "Work Study"
-        ]
-        
-        df = pd.DataFrame(columns=columns)
+        shutil.copyfile(TEMPLATE_ASSET, template_path)
+        print(f"Created template Excel file at {template_path}")
+        return
+    except FileNotFoundError:
+        pass
+    
+    try:
+        from openpyxl import Workbook
         
-        # Add example data
+        # Create worker template with example data
         example_data = {
             "First Name": ["John", "Jane"],
             "Last Name": ["Doe", "Smith"],
@@ -216,55 +373,92 @@ def create_template_excel():
             "Work Study": ["Y", "N"]
         }
         
-        example_df = pd.DataFrame(example_data)
+        wb = Workbook()
+        ws = wb.active
+        ws.append(list(example_data))
+        for row in zip(*example_data.values()):
+            ws.append(list(row))
         
         # Save template
-        template_path = os.path.join(templates_dir, "worker_template.xlsx")
-        example_df.to_excel(template_path, index=False)
+        wb.save(template_path)
         
         print(f"Created template Excel file at {template_path}")
     except ImportError:
-        print("Failed to create template Excel file. Please make sure pandas and openpyxl are installed.")
+        print("Failed to create template Excel file. Please make sure openpyxl is installed.")
 
-def copy_app_files():
+def copy_app_files(base_dir=BASE_DIR):
     """Copy application files to the installation directory"""
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    
     # Create app files if they don't exist
     app_files = ["main.py", "scheduler.py", "utils.py"]
     
+    # One directory listing instead of a stat per file
+    with os.scandir(base_dir) as entries:
+        present = {entry.name for entry in entries}
+    
     for file in app_files:
-        if not os.path.exists(os.path.join(base_dir, file)):
+        if file not in present:
             print(f"Warning: {file} not found in the installation directory.")
+    
+    return present
+
+def compile_app_files(base_dir=BASE_DIR):
+    """Precompile the app's imported modules so the first launch skips parsing them"""
+    # main.py runs as a script and is never loaded from __pycache__
+    for file in ["scheduler.py", "utils.py"]:
+        try:
+            py_compile.compile(os.path.join(base_dir, file), doraise=True)
+        except (OSError, py_compile.PyCompileError) as e:
+            print(f"Warning: Could not precompile {file}: {e}")
 
 def main():
     # Check if running on Windows
-    if platform.system() != "Windows":
+    if not IS_WIN:
         print("This installer is designed for Windows only.")
         sys.exit(1)
     
-    print("Starting installation of Workplace Scheduler App...")
+    script_path = os.path.join(BASE_DIR, "main.py")
     
-    # Install dependencies
-    install_dependencies()
+    # Elevated relaunch only needs to retry the shortcut, not the whole install
+    if "--shortcut-only" in sys.argv[1:]:
+        create_windows_shortcut(script_path, "Workplace Scheduler")
+        return
     
-    # Create folder structure
-    create_folder_structure()
+    # Nothing to redo if a previous run already finished with the same packages
+    if "--force" not in sys.argv[1:] and is_install_current():
+        print("Workplace Scheduler App is already installed. Use --force to reinstall.")
+        return
     
-    # Create template Excel files
-    create_template_excel()
+    print("Starting installation of Workplace Scheduler App...")
+    
+    # Install dependencies
+    deps_installed = install_dependencies()
     
     # Copy app files
-    copy_app_files()
+    present = copy_app_files()
     
-    # Create desktop shortcut and batch file
-    script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    # The directory listing already tells us whether main.py is there to launch
+    can_launch = "main.py" in present
+    if not can_launch:
+        print("\nSkipping desktop shortcut and batch file because main.py is missing.")
     
-    # Try to create shortcut
-    shortcut_created = create_windows_shortcut(script_path, "Workplace Scheduler")
+    # The remaining stages only need the dependencies, so run them side by side
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        # Data folders, the template and bytecode don't need main.py, so they always run
+        stages = [
+            executor.submit(create_folder_structure),
+            executor.submit(create_template_excel),
+            executor.submit(compile_app_files)
+        ]
+        shortcut_stage = None
+        if can_launch:
+            # Always create batch file as a backup
+            stages.append(executor.submit(create_windows_batch_file, script_path, "Workplace Scheduler"))
+            shortcut_stage = executor.submit(create_windows_shortcut, script_path, "Workplace Scheduler")
+            stages.append(shortcut_stage)
+        for stage in stages:
+            stage.result()
     
-    # Always create batch file as a backup
-    create_windows_batch_file(script_path, "Workplace Scheduler")
+    shortcut_created = shortcut_stage is None or shortcut_stage.result()
     
     # If shortcut creation failed and not running as admin, offer to run as admin
     if not shortcut_created and not is_admin():
@@ -272,9 +466,12 @@ def main():
         response = input("Would you like to run the installer with administrator privileges? (y/n): ")
         
         if response.lower() in ['y', 'yes']:
-            print("Restarting with admin privileges...")
+            print("Retrying the desktop shortcut with admin privileges...")
             run_as_admin()
-            sys.exit(0)
+    
+    # Only mark the install as done once every package made it in
+    if deps_installed:
+        write_file(INSTALL_MARKER, install_stamp())
     
     print("\nInstallation completed successfully!")
     print("You can now run the application using one of these methods:")
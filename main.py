@@ -1,20 +1,21 @@
 import os
-import sys
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
 from datetime import datetime
-from tkcalendar import DateEntry
-from PIL import Image, ImageTk
 
 from utils import (
     load_json_data, save_json_data, get_workplace_path, get_workers_path,
     get_config_path, get_schedules_path, get_settings_path,
     import_workers_from_excel, export_workers_to_excel,
-    parse_time_range, format_time_12hr, backup_data, restore_data
+    parse_availability, parse_unavailable_time, merge_time_ranges, convert_time_to_24hr, format_time_12hr,
+    backup_data, restore_data, clear_json_cache
 )
-from scheduler import ScheduleGenerator
+
+# background pool for slow file writes, so the window keeps responding
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
 
 class WorkplaceSchedulerApp:
     def __init__(self, root):
@@ -33,6 +34,41 @@ class WorkplaceSchedulerApp:
         # initialize current workplace
         self.current_workplace = None
         
+        # workers per workplace, kept until the file's mtime changes
+        self._workers_cache = {}
+        self._workers_mtime = {}
+        
+        # lowercase (first, last) names per workplace for duplicate checks
+        self._name_index = {}
+        
+        # workers per workplace keyed by id (ints for new workers, strings from older files)
+        self._workers_by_id = {}
+        
+        # full "first last" display names per workplace, keyed by worker id
+        self._display_names = {}
+        
+        # workplaces whose cached workers haven't been written yet
+        self._dirty_workplaces = set()
+        self._flush_id = None
+        
+        # replacement searches keyed by (workplace, day, start, end, workers mtime)
+        self._replacement_cache = {}
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # add-worker form fields, created once and cleared whenever the form opens
+        self._add_form_vars = {
+            "first_name": tk.StringVar(),
+            "last_name": tk.StringVar(),
+            "email": tk.StringVar(),
+            "work_study": tk.BooleanVar(),
+            "unavailable": [tk.StringVar(), tk.StringVar()]
+        }
+        
+        # pages built so far, hidden and shown again instead of rebuilt
+        self._pages = {}
+        self._page_versions = {}
+        self._current_page = None
+        
         # create main frame
         self.main_frame = ttk.Frame(self.root, padding=10)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -60,6 +96,146 @@ class WorkplaceSchedulerApp:
         # configure frame styles
         style.configure("Card.TFrame", relief="raised", borderwidth=1)
     
+    def _get_workers(self, workplace=None):
+        """Get the workers for a workplace, re-reading the file only when it changed"""
+        workplace = workplace or self.current_workplace
+        
+        # unsaved edits live only in the cache until the next flush
+        if workplace in self._dirty_workplaces:
+            return self._workers_cache[workplace]
+        
+        workers_path = get_workers_path(self.base_dir, workplace)
+        
+        try:
+            mtime = os.stat(workers_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if workplace not in self._workers_cache or self._workers_mtime.get(workplace) != mtime:
+            workers = load_json_data(workers_path, [])
+            self._workers_cache[workplace] = workers
+            self._workers_mtime[workplace] = mtime
+            self._name_index[workplace] = self._build_name_index(workers)
+            self._workers_by_id[workplace] = {w["id"]: w for w in workers}
+            self._display_names[workplace] = self._build_display_names(workers)
+        
+        return self._workers_cache[workplace]
+    
+    def _next_worker_id(self, workplace=None):
+        """Get the next free integer worker id for a workplace"""
+        workplace = workplace or self.current_workplace
+        self._get_workers(workplace)
+        int_ids = [i for i in self._workers_by_id[workplace] if isinstance(i, int)]
+        return max(int_ids, default=-1) + 1
+    
+    @staticmethod
+    def _build_name_index(workers):
+        """Build the set of lowercase (first, last) names for duplicate checks"""
+        return {(w["first_name"].lower(), w["last_name"].lower()) for w in workers}
+    
+    @staticmethod
+    def _build_display_names(workers):
+        """Format each worker's full name once, keyed by worker id"""
+        return {w["id"]: f"{w['first_name']} {w['last_name']}" for w in workers}
+    
+    def _get_display_names(self, workplace=None):
+        """Get the full names of a workplace's workers, keyed by worker id"""
+        workplace = workplace or self.current_workplace
+        self._get_workers(workplace)
+        return self._display_names[workplace]
+    
+    def _get_name_index(self, workplace=None):
+        """Get the set of lowercase worker names for a workplace"""
+        workplace = workplace or self.current_workplace
+        self._get_workers(workplace)
+        return self._name_index[workplace]
+    
+    def _save_workers(self, workers, workplace=None, defer=False):
+        """Save the workers for a workplace and refresh the cached copy
+        
+        With defer=True only the cache is updated and the file is written by a
+        debounced flush, so several quick edits cost one write.
+        """
+        workplace = workplace or self.current_workplace
+        
+        if defer:
+            self._set_cached_workers(workplace, workers)
+            self._dirty_workplaces.add(workplace)
+            self._schedule_flush()
+            return True
+        
+        self._dirty_workplaces.discard(workplace)
+        workers_path = get_workers_path(self.base_dir, workplace)
+        
+        success = save_json_data(workers_path, workers)
+        if success:
+            self._set_cached_workers(workplace, workers)
+            self._update_workers_mtime(workplace)
+        
+        return success
+    
+    def _set_cached_workers(self, workplace, workers):
+        """Replace the cached workers for a workplace"""
+        self._workers_cache[workplace] = workers
+        self._workers_by_id[workplace] = {w["id"]: w for w in workers}
+        self._display_names[workplace] = self._build_display_names(workers)
+        if workplace not in self._name_index:
+            self._name_index[workplace] = self._build_name_index(workers)
+        self._replacement_cache.clear()
+    
+    def _update_workers_mtime(self, workplace):
+        """Record the workers file's new mtime after this app wrote it"""
+        workers_path = get_workers_path(self.base_dir, workplace)
+        self._workers_mtime[workplace] = os.stat(workers_path).st_mtime_ns
+        
+        # the cached workers page may not show this write, so rebuild it next time
+        self._page_versions.pop("workers", None)
+    
+    def _schedule_flush(self, delay=250):
+        """Write dirty workers files after a short pause, restarting the timer on each edit"""
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+        self._flush_id = self.root.after(delay, self._flush_workers)
+    
+    def _flush_workers(self):
+        """Write every workplace with unsaved worker changes"""
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        
+        for workplace in list(self._dirty_workplaces):
+            workers_path = get_workers_path(self.base_dir, workplace)
+            if save_json_data(workers_path, self._workers_cache[workplace]):
+                self._dirty_workplaces.discard(workplace)
+                self._update_workers_mtime(workplace)
+            else:
+                messagebox.showerror("Error", f"An error occurred while saving workers for {workplace}.")
+    
+    def _on_close(self):
+        """Save pending changes before the main window closes"""
+        self._flush_workers()
+        self.root.destroy()
+    
+    def _show_page(self, key, version=None):
+        """Show a cached page, or create an empty one to build, returning (page, cached)"""
+        for page in self._pages.values():
+            page.pack_forget()
+        self._current_page = key
+        
+        page = self._pages.get(key)
+        if page is not None and page.winfo_exists() and self._page_versions.get(key) == version:
+            page.pack(fill=tk.BOTH, expand=True)
+            return page, True
+        
+        # stale or missing, so build a fresh one
+        if page is not None:
+            page.destroy()
+        page = ttk.Frame(self.main_frame)
+        page.pack(fill=tk.BOTH, expand=True)
+        self._pages[key] = page
+        self._page_versions[key] = version
+        return page, False
+    
     def clear_frame(self, frame):
         """Clear all widgets from a frame"""
         for widget in frame.winfo_children():
@@ -67,11 +243,16 @@ class WorkplaceSchedulerApp:
     
     def show_dashboard(self):
         """Show the main dashboard"""
-        # clear main frame
-        self.clear_frame(self.main_frame)
+        # leaving a workplace is a good point to write pending edits
+        self._flush_workers()
+        
+        # reuse the dashboard if it was already built
+        page, cached = self._show_page("dashboard")
+        if cached:
+            return
         
         # create header frame
-        header_frame = ttk.Frame(self.main_frame)
+        header_frame = ttk.Frame(page)
         header_frame.pack(fill=tk.X, pady=(0, 20))
         
         # add title
@@ -91,14 +272,14 @@ class WorkplaceSchedulerApp:
         
         def save_email():
             self.settings["email"] = email_var.get()
-            save_json_data(self.settings_path, self.settings)
+            save_json_data(self.settings_path, self.settings, pretty=True)
             messagebox.showinfo("Success", "Email saved successfully!")
         
         save_button = ttk.Button(email_frame, text="Save", command=save_email)
         save_button.pack(side=tk.LEFT, padx=(5, 0))
         
         # create workplaces frame
-        workplaces_frame = ttk.Frame(self.main_frame)
+        workplaces_frame = ttk.Frame(page)
         workplaces_frame.pack(fill=tk.BOTH, expand=True)
         
         # add workplaces title
@@ -110,8 +291,9 @@ class WorkplaceSchedulerApp:
         workplaces = []
         
         if os.path.exists(workplaces_dir):
-            workplaces = [d for d in os.listdir(workplaces_dir) 
-                         if os.path.isdir(os.path.join(workplaces_dir, d)) and d != "backup"]
+            # scandir entries know whether they are directories without another stat
+            with os.scandir(workplaces_dir) as entries:
+                workplaces = sorted(entry.name for entry in entries if entry.is_dir() and entry.name != "backup")
         
         # add workplace buttons
         for workplace in workplaces:
@@ -124,7 +306,7 @@ class WorkplaceSchedulerApp:
             workplace_button.pack(fill=tk.X, pady=5)
         
         # add backup/restore frame
-        backup_frame = ttk.Frame(self.main_frame)
+        backup_frame = ttk.Frame(page)
         backup_frame.pack(fill=tk.X, pady=(20, 0))
         
         backup_button = ttk.Button(
@@ -146,8 +328,7 @@ class WorkplaceSchedulerApp:
         self.current_workplace = workplace_name
         
         # check if workplace has workers
-        workers_path = get_workers_path(self.base_dir, workplace_name)
-        workers = load_json_data(workers_path, [])
+        workers = self._get_workers(workplace_name)
         
         if not workers:
             # ask to import workers first
@@ -167,11 +348,13 @@ class WorkplaceSchedulerApp:
     
     def show_workplace(self):
         """Show workplace page"""
-        # clear main frame
-        self.clear_frame(self.main_frame)
+        # reuse this workplace's page if it was already built
+        page, cached = self._show_page(f"workplace:{self.current_workplace}")
+        if cached:
+            return
         
         # create header frame
-        header_frame = ttk.Frame(self.main_frame)
+        header_frame = ttk.Frame(page)
         header_frame.pack(fill=tk.X, pady=(0, 20))
         
         # add back button
@@ -187,7 +370,7 @@ class WorkplaceSchedulerApp:
         title_label.pack(side=tk.LEFT, padx=(20, 0))
         
         # create actions frame
-        actions_frame = ttk.Frame(self.main_frame)
+        actions_frame = ttk.Frame(page)
         actions_frame.pack(fill=tk.BOTH, expand=True)
         
         # add action buttons
@@ -241,11 +424,16 @@ class WorkplaceSchedulerApp:
     
     def view_workers(self):
         """View workers and their availability"""
-        # clear main frame
-        self.clear_frame(self.main_frame)
+        # load workers
+        workers = self._get_workers()
+        
+        # reuse the workers page unless the workplace or its workers file changed
+        page, cached = self._show_page("workers", self._workers_version())
+        if cached:
+            return
         
         # create header frame
-        header_frame = ttk.Frame(self.main_frame)
+        header_frame = ttk.Frame(page)
         header_frame.pack(fill=tk.X, pady=(0, 20))
         
         # add back button
@@ -260,87 +448,119 @@ class WorkplaceSchedulerApp:
         title_label = ttk.Label(header_frame, text=f"Workers - {self.current_workplace}", style="Title.TLabel")
         title_label.pack(side=tk.LEFT, padx=(20, 0))
         
-        # load workers
-        workers_path = get_workers_path(self.base_dir, self.current_workplace)
-        workers = load_json_data(workers_path, [])
-        
         # create workers frame
-        workers_frame = ttk.Frame(self.main_frame)
+        workers_frame = ttk.Frame(page)
         workers_frame.pack(fill=tk.BOTH, expand=True)
         
-        # create scrollable frame
-        canvas = tk.Canvas(workers_frame)
-        scrollbar = ttk.Scrollbar(workers_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # treeview only draws the visible rows, unlike a frame of widgets per worker
+        tree = ttk.Treeview(workers_frame, columns=("name", "email", "work_study"), show="headings")
+        tree.heading("name", text="Name")
+        tree.heading("email", text="Email")
+        tree.heading("work_study", text="Work Study")
+        tree.column("name", width=200)
+        tree.column("email", width=300)
+        tree.column("work_study", width=100, anchor=tk.CENTER)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(workers_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
         
-        canvas.pack(side="left", fill="both", expand=True)
+        tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # add workers to scrollable frame
-        if not workers:
-            no_workers_label = ttk.Label(scrollable_frame, text="No workers found.", style="Info.TLabel")
-            no_workers_label.pack(pady=20)
-        else:
-            # create header row
-            header_frame = ttk.Frame(scrollable_frame)
-            header_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            ttk.Label(header_frame, text="Name", width=20, font=("Arial", 12, "bold")).grid(row=0, column=0, padx=5)
-            ttk.Label(header_frame, text="Email", width=30, font=("Arial", 12, "bold")).grid(row=0, column=1, padx=5)
-            ttk.Label(header_frame, text="Work Study", width=10, font=("Arial", 12, "bold")).grid(row=0, column=2, padx=5)
-            ttk.Label(header_frame, text="Actions", width=10, font=("Arial", 12, "bold")).grid(row=0, column=3, padx=5)
-            
-            # add separator
-            ttk.Separator(scrollable_frame, orient="horizontal").pack(fill=tk.X, pady=(0, 10))
-            
-            # add each worker
-            for i, worker in enumerate(workers):
-                worker_frame = ttk.Frame(scrollable_frame)
-                worker_frame.pack(fill=tk.X, pady=5)
-                
-                name = f"{worker['first_name']} {worker['last_name']}"
-                email = worker.get("email", "")
-                work_study = "Yes" if worker.get("work_study", False) else "No"
-                
-                ttk.Label(worker_frame, text=name, width=20).grid(row=0, column=0, padx=5)
-                ttk.Label(worker_frame, text=email, width=30).grid(row=0, column=1, padx=5)
-                ttk.Label(worker_frame, text=work_study, width=10).grid(row=0, column=2, padx=5)
-                
-                # add view details button
-                view_button = ttk.Button(
-                    worker_frame,
-                    text="Details",
-                    command=lambda w=worker: self.view_worker_details(w)
-                )
-                view_button.grid(row=0, column=3, padx=5)
-                
-                # add remove button
-                remove_button = ttk.Button(
-                    worker_frame,
-                    text="Remove",
-                    command=lambda w=worker: self.remove_worker(w)
-                )
-                remove_button.grid(row=0, column=4, padx=5)
-                
-                # add separator after each worker except the last one
-                if i < len(workers) - 1:
-                    ttk.Separator(scrollable_frame, orient="horizontal").pack(fill=tk.X, pady=(5, 0))
+        # add each worker, using its id as the row id
+        self._workers_tree = tree
+        for worker in workers:
+            self._insert_worker_row(worker)
+        
+        # add buttons acting on the selected worker
+        buttons_frame = ttk.Frame(page)
+        buttons_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        tree.bind("<Double-1>", lambda e: self._on_worker_action(self.view_worker_details))
+        
+        ttk.Button(
+            buttons_frame,
+            text="Details",
+            command=lambda: self._on_worker_action(self.view_worker_details)
+        ).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(
+            buttons_frame,
+            text="Remove",
+            command=lambda: self._on_worker_action(self.remove_worker)
+        ).pack(side=tk.LEFT)
+        
+        self._workers_count_label = ttk.Label(buttons_frame, style="Info.TLabel")
+        self._workers_count_label.pack(side=tk.RIGHT)
+        self._update_worker_count()
+    
+    def _workers_tree_shown(self):
+        """Check if the workers list is currently on screen"""
+        tree = getattr(self, "_workers_tree", None)
+        return self._current_page == "workers" and tree is not None and tree.winfo_exists()
+    
+    def _workers_version(self):
+        """Identify which workplace and workers file the workers page was built from"""
+        return (self.current_workplace, self._workers_mtime.get(self.current_workplace))
+    
+    def _insert_worker_row(self, worker):
+        """Add one worker to the workers list"""
+        name = self._get_display_names()[worker["id"]]
+        email = worker.get("email", "")
+        work_study = "Yes" if worker.get("work_study", False) else "No"
+        
+        self._workers_tree.insert("", "end", iid=str(worker["id"]), values=(name, email, work_study))
+    
+    def _on_worker_action(self, action):
+        """Run an action on the worker in the focused row of the workers list"""
+        iid = self._workers_tree.focus()
+        if not iid:
+            return
+        
+        # row ids are worker ids as text; new workers have integer ids
+        workers_by_id = self._workers_by_id.get(self.current_workplace, {})
+        worker = workers_by_id.get(int(iid)) if iid.isdigit() else workers_by_id.get(iid)
+        if worker:
+            action(worker)
+    
+    def _update_worker_count(self):
+        """Update the worker count under the workers list"""
+        count = len(self._workers_tree.get_children())
+        self._workers_count_label.configure(text=f"{count} workers" if count else "No workers found.")
+    
+    def _get_pooled_window(self, attr, geometry, minsize):
+        """Get a reusable top-level window, creating it on first use"""
+        window = getattr(self, attr, None)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return window, False
+        
+        window = tk.Toplevel(self.root)
+        window.geometry(geometry)
+        window.minsize(*minsize)
+        
+        # closing only hides the window so the next use skips building it
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        setattr(self, attr, window)
+        return window, True
+    
+    @staticmethod
+    def _day_to_str(worker, day):
+        """Describe a worker's availability on one day"""
+        availability = worker.get("availability", {}).get(day, [])
+        if not availability:
+            return "Not available"
+        return ", ".join(
+            f"{format_time_12hr(time_range['start'])} - {format_time_12hr(time_range['end'])}"
+            for time_range in availability
+        )
     
     def view_worker_details(self, worker):
         """View details for a specific worker"""
-        # create a new top-level window
-        details_window = tk.Toplevel(self.root)
+        # reuse the details window, only its contents change between workers
+        details_window, _ = self._get_pooled_window("_details_window", "600x500", (600, 500))
+        self.clear_frame(details_window)
         details_window.title(f"Worker Details - {worker['first_name']} {worker['last_name']}")
-        details_window.geometry("600x500")
-        details_window.minsize(600, 500)
         
         # create main frame
         main_frame = ttk.Frame(details_window, padding=10)
@@ -362,63 +582,38 @@ class WorkplaceSchedulerApp:
         # add availability section
         ttk.Label(main_frame, text="Availability", style="Subtitle.TLabel").pack(anchor=tk.W, pady=(0, 10))
         
-        # create scrollable frame for availability
-        canvas = tk.Canvas(main_frame)
-        scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # add availability for each day
+        # one read-only treeview row per day
         days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+        availability_tree = ttk.Treeview(main_frame, columns=("range",), height=len(days))
+        availability_tree.heading("#0", text="Day")
+        availability_tree.heading("range", text="Available Times")
+        availability_tree.column("#0", width=120)
+        availability_tree.column("range", width=420)
+        availability_tree.pack(fill=tk.X)
         
-        for i, day in enumerate(days):
-            day_frame = ttk.Frame(scrollable_frame)
-            day_frame.pack(fill=tk.X, pady=5)
-            
-            ttk.Label(day_frame, text=f"{day}:", width=15, style="Info.TLabel").grid(row=0, column=0, sticky=tk.W)
-            
-            # get availability for this day
-            availability = worker.get("availability", {}).get(day, [])
-            
-            if not availability:
-                ttk.Label(day_frame, text="Not available").grid(row=0, column=1, sticky=tk.W)
-            else:
-                availability_text = ", ".join([
-                    f"{format_time_12hr(time_range['start'])} - {format_time_12hr(time_range['end'])}"
-                    for time_range in availability
-                ])
-                ttk.Label(day_frame, text=availability_text).grid(row=0, column=1, sticky=tk.W)
+        for day in days:
+            availability_tree.insert("", "end", text=day, values=(self._day_to_str(worker, day),))
+        
+        unavailable_frame = ttk.Frame(main_frame)
+        unavailable_frame.pack(fill=tk.BOTH, expand=True)
         
         # add unavailable times section
-        ttk.Label(scrollable_frame, text="Unavailable Times", style="Subtitle.TLabel").pack(anchor=tk.W, pady=(20, 10))
+        ttk.Label(unavailable_frame, text="Unavailable Times", style="Subtitle.TLabel").pack(anchor=tk.W, pady=(20, 10))
       
         # add unavailable times for each day
         unavailable = worker.get("unavailable", {})
         
         if not unavailable:
-            ttk.Label(scrollable_frame, text="No unavailable times specified.").pack(anchor=tk.W)
+            ttk.Label(unavailable_frame, text="No unavailable times specified.").pack(anchor=tk.W)
         else:
-            for day, times in unavailable.items():
-                day_frame = ttk.Frame(scrollable_frame)
-                day_frame.pack(fill=tk.X, pady=5)
-                
-                ttk.Label(day_frame, text=f"{day}:", width=15, style="Info.TLabel").grid(row=0, column=0, sticky=tk.W)
-                
-                times_text = ", ".join([
-                    f"{format_time_12hr(start)} - {format_time_12hr(end)}"
-                    for start, end in times
-                ])
-                ttk.Label(day_frame, text=times_text).grid(row=0, column=1, sticky=tk.W)
+            # one monospaced label for all days instead of a frame and labels per day
+            unavailable_text = "\n".join(
+                f"{day + ':':11s}" + ", ".join(
+                    f"{format_time_12hr(start)} - {format_time_12hr(end)}" for start, end in times
+                )
+                for day, times in unavailable.items()
+            )
+            ttk.Label(unavailable_frame, text=unavailable_text, font=("Courier", 11), justify=tk.LEFT).pack(anchor=tk.W)
     
     def remove_worker(self, worker):
         """Remove a worker from the workplace"""
@@ -431,26 +626,103 @@ class WorkplaceSchedulerApp:
         if not result:
             return
         
-        # load workers
-        workers_path = get_workers_path(self.base_dir, self.current_workplace)
-        workers = load_json_data(workers_path, [])
+        # remove worker by id from a copy that then replaces the cached list
+        self._get_workers()
+        workers_by_id = dict(self._workers_by_id[self.current_workplace])
+        workers_by_id.pop(worker["id"], None)
+        workers = list(workers_by_id.values())
+        
+        # save workers (written by the debounced flush)
+        self._save_workers(workers, defer=True)
+        
+        self._get_name_index().discard((worker["first_name"].lower(), worker["last_name"].lower()))
+        
+        # drop just this row instead of rebuilding the whole list
+        iid = str(worker["id"])
+        if not self._workers_tree_shown() or not self._workers_tree.exists(iid):
+            self._page_versions.pop("workers", None)
+            self.view_workers()
+            return
         
-        # remove worker
-        workers = [w for w in workers if w["id"] != worker["id"]]
+        self._workers_tree.delete(iid)
+        self._update_worker_count()
+        self._page_versions["workers"] = self._workers_version()
+    
+    def _edit_tree_cell(self, tree, iid, column, values=None, on_change=None):
+        """Edit one Treeview cell in place with an Entry laid over it.
         
-        # save workers
-        save_json_data(workers_path, workers)
+        With values, a read-only Combobox of those choices is used instead,
+        and on_change(iid, value) is called after a new value is set.
+        """
+        self._finish_cell_edit()
+        
+        # only value columns are editable, not the row label
+        bbox = tree.bbox(iid, column) if iid and column != "#0" else None
+        if not bbox:
+            return
         
-        # refresh view
-        self.view_workers()
+        x, y, width, height = bbox
+        if values is None:
+            entry = ttk.Entry(tree)
+            entry.insert(0, tree.set(iid, column))
+            entry.select_range(0, tk.END)
+        else:
+            entry = ttk.Combobox(tree, values=values, state="readonly")
+            entry.set(tree.set(iid, column))
+        entry.place(x=x, y=y, width=width, height=height)
+        entry.focus_set()
+        
+        def finish(save=True):
+            if self._cell_edit is not finish:
+                return
+            self._cell_edit = None
+            # the window holding the cell may have been closed meanwhile
+            if not entry.winfo_exists():
+                return
+            value = entry.get()
+            if save and value != tree.set(iid, column):
+                tree.set(iid, column, value)
+                if on_change is not None:
+                    on_change(iid, value)
+            entry.destroy()
+        
+        entry.bind("<Return>", lambda e: finish())
+        entry.bind("<Escape>", lambda e: finish(save=False))
+        if values is None:
+            entry.bind("<FocusOut>", lambda e: finish())
+        else:
+            # the dropdown list takes focus while open, so commit on selection instead
+            entry.bind("<<ComboboxSelected>>", lambda e: finish())
+        self._cell_edit = finish
+    
+    def _finish_cell_edit(self):
+        """Commit the in-place cell edit, if one is open"""
+        finish = getattr(self, "_cell_edit", None)
+        if finish is not None:
+            finish()
     
     def add_worker_manually(self):
         """Add a new worker manually"""
-        # create a new top-level window
-        add_window = tk.Toplevel(self.root)
+        # reuse the form window if it was built before, just clearing its fields
+        add_window, created = self._get_pooled_window("_add_window", "800x600", (800, 600))
         add_window.title(f"Add Worker - {self.current_workplace}")
-        add_window.geometry("800x600")
-        add_window.minsize(800, 600)
+        
+        # form variables live for the whole session, so opening the form only clears them
+        first_name_var = self._add_form_vars["first_name"]
+        last_name_var = self._add_form_vars["last_name"]
+        email_var = self._add_form_vars["email"]
+        work_study_var = self._add_form_vars["work_study"]
+        unavailable_vars = self._add_form_vars["unavailable"]
+        
+        for var in (first_name_var, last_name_var, email_var, *unavailable_vars):
+            var.set("")
+        work_study_var.set(False)
+        
+        if not created:
+            self._finish_cell_edit()
+            for day in self._add_availability_tree.get_children():
+                self._add_availability_tree.set(day, "range", "")
+            return
         
         # create main frame
         main_frame = ttk.Frame(add_window, padding=10)
@@ -469,10 +741,48 @@ class WorkplaceSchedulerApp:
         scrollbar = ttk.Scrollbar(form_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # resize the scroll region once per idle pass, not on every child resize
+        scrollregion_pending = [False]
+        
+        def update_scrollregion():
+            scrollregion_pending[0] = False
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def on_configure(event):
+            if not scrollregion_pending[0]:
+                scrollregion_pending[0] = True
+                canvas.after_idle(update_scrollregion)
+        
+        scrollable_frame.bind("<Configure>", on_configure)
+        
+        # wheel ticks are summed and applied in one scroll per idle pass
+        wheel_pending = [0]
+        
+        def apply_wheel():
+            if canvas.winfo_exists() and wheel_pending[0]:
+                canvas.yview_scroll(wheel_pending[0], "units")
+            wheel_pending[0] = 0
+        
+        def on_wheel(event):
+            if not wheel_pending[0]:
+                canvas.after_idle(apply_wheel)
+            wheel_pending[0] += -1 if event.num == 4 or event.delta > 0 else 1
+        
+        # the pointer is usually over a form field, so listen app-wide while it's inside the form
+        def bind_wheel(event):
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.bind_all(sequence, on_wheel)
+        
+        def unbind_wheel(event):
+            # moving onto a field inside the form also counts as leaving the canvas
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is not None and str(widget).startswith(str(canvas)):
+                return
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                canvas.unbind_all(sequence)
+        
+        canvas.bind("<Enter>", bind_wheel)
+        canvas.bind("<Leave>", unbind_wheel)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -492,7 +802,6 @@ class WorkplaceSchedulerApp:
         first_name_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(first_name_frame, text="First Name:", width=15).pack(side=tk.LEFT)
-        first_name_var = tk.StringVar()
         ttk.Entry(first_name_frame, textvariable=first_name_var, width=30).pack(side=tk.LEFT)
         
         # last name
@@ -500,7 +809,6 @@ class WorkplaceSchedulerApp:
         last_name_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(last_name_frame, text="Last Name:", width=15).pack(side=tk.LEFT)
-        last_name_var = tk.StringVar()
         ttk.Entry(last_name_frame, textvariable=last_name_var, width=30).pack(side=tk.LEFT)
         
         # email
@@ -508,7 +816,6 @@ class WorkplaceSchedulerApp:
         email_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(email_frame, text="Email:", width=15).pack(side=tk.LEFT)
-        email_var = tk.StringVar()
         ttk.Entry(email_frame, textvariable=email_var, width=30).pack(side=tk.LEFT)
         
         # work study
@@ -516,7 +823,6 @@ class WorkplaceSchedulerApp:
         work_study_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(work_study_frame, text="Work Study:", width=15).pack(side=tk.LEFT)
-        work_study_var = tk.BooleanVar()
         ttk.Checkbutton(work_study_frame, variable=work_study_var).pack(side=tk.LEFT)
         
         # availability
@@ -525,21 +831,32 @@ class WorkplaceSchedulerApp:
         
         ttk.Label(availability_frame, text="Availability", style="Subtitle.TLabel").pack(anchor=tk.W, pady=(0, 10))
         
-        # add availability for each day
+        ttk.Label(
+            availability_frame,
+            text="Double-click a day to edit. Format: 12pm - 8pm (or 'na' if not available)"
+        ).pack(anchor=tk.W, pady=(0, 5))
+        
+        # one treeview row per day instead of a frame, label and entry for each
         days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-        availability_vars = {}
+        availability_tree = ttk.Treeview(availability_frame, columns=("range",), height=len(days))
+        availability_tree.heading("#0", text="Day")
+        availability_tree.heading("range", text="Available Times")
+        availability_tree.column("#0", width=120)
+        availability_tree.column("range", width=300)
+        availability_tree.pack(anchor=tk.W)
         
         for day in days:
-            day_frame = ttk.Frame(availability_frame)
-            day_frame.pack(fill=tk.X, pady=5)
-            
-            ttk.Label(day_frame, text=f"{day}:", width=15).pack(side=tk.LEFT)
-            
-            day_var = tk.StringVar()
-            ttk.Entry(day_frame, textvariable=day_var, width=30).pack(side=tk.LEFT)
-            ttk.Label(day_frame, text="Format: 12pm - 8pm (or 'na' if not available)").pack(side=tk.LEFT, padx=(10, 0))
-            
-            availability_vars[day] = day_var
+            availability_tree.insert("", "end", iid=day, text=day, values=("",))
+        
+        availability_tree.bind(
+            "<Double-1>",
+            lambda e: self._edit_tree_cell(
+                availability_tree,
+                availability_tree.identify_row(e.y),
+                availability_tree.identify_column(e.x)
+            )
+        )
+        self._add_availability_tree = availability_tree
         
         # unavailable times
         unavailable_frame = ttk.Frame(scrollable_frame)
@@ -548,34 +865,34 @@ class WorkplaceSchedulerApp:
         ttk.Label(unavailable_frame, text="Unavailable Times", style="Subtitle.TLabel").pack(anchor=tk.W, pady=(0, 10))
         
         # add unavailable time fields
-        unavailable_vars = []
-        
-        for i in range(2):
+        for i, unavail_var in enumerate(unavailable_vars):
             unavail_frame = ttk.Frame(unavailable_frame)
             unavail_frame.pack(fill=tk.X, pady=5)
             
             ttk.Label(unavail_frame, text=f"Unavailable {i+1}:", width=15).pack(side=tk.LEFT)
             
-            unavail_var = tk.StringVar()
             ttk.Entry(unavail_frame, textvariable=unavail_var, width=30).pack(side=tk.LEFT)
             ttk.Label(unavail_frame, text="Format: MWF 1pm - 2pm (or 'na' if not applicable)").pack(side=tk.LEFT, padx=(10, 0))
-            
-            unavailable_vars.append(unavail_var)
         
-        # add save button
-        save_button = ttk.Button(
-            scrollable_frame,
-            text="Save Worker",
-            style="Action.TButton",
-            command=lambda: self.save_new_worker(
+        def save():
+            # keep a half-finished cell edit
+            self._finish_cell_edit()
+            self.save_new_worker(
                 first_name_var.get(),
                 last_name_var.get(),
                 email_var.get(),
                 work_study_var.get(),
-                {day: var.get() for day, var in availability_vars.items()},
+                {day: availability_tree.set(day, "range") for day in days},
                 [var.get() for var in unavailable_vars],
                 add_window
             )
+        
+        # add save button
+        save_button = ttk.Button(
+            scrollable_frame,
+            text="Save Worker",
+            style="Action.TButton",
+            command=save
         )
         save_button.pack(pady=20)
     
@@ -586,70 +903,35 @@ class WorkplaceSchedulerApp:
             messagebox.showerror("Error", "First name and last name are required.")
             return
         
-        # load workers
-        workers_path = get_workers_path(self.base_dir, self.current_workplace)
-        workers = load_json_data(workers_path, [])
+        # load workers (a copy, the cached list is replaced on save)
+        workers = list(self._get_workers())
         
         # check for duplicate
-        for worker in workers:
-            if (worker["first_name"].lower() == first_name.lower() and 
-                worker["last_name"].lower() == last_name.lower()):
-                messagebox.showerror("Error", f"A worker with the name {first_name} {last_name} already exists.")
-                return
+        names = self._get_name_index()
+        name_key = (first_name.lower(), last_name.lower())
+        if name_key in names:
+            messagebox.showerror("Error", f"A worker with the name {first_name} {last_name} already exists.")
+            return
         
         # process availability
-        processed_availability = {}
-        for day, time_range in availability.items():
-            if not time_range or time_range.lower() == 'na':
-                processed_availability[day] = []
-            else:
-                # split multiple time ranges if present
-                ranges = [r.strip() for r in time_range.split(',')]
-                day_ranges = []
-                for r in ranges:
-                    start_time, end_time = parse_time_range(r)
-                    if start_time and end_time:
-                        day_ranges.append({
-                            "start": start_time,
-                            "end": end_time
-                        })
-                processed_availability[day] = day_ranges
+        processed_availability = {
+            day: parse_availability(time_range) for day, time_range in availability.items()
+        }
         
         # process unavailable times
         processed_unavailable = {}
         for unavail_str in unavailable_times:
-            if not unavail_str or unavail_str.lower() == 'na':
-                continue
-                
-            # extract day codes and time range
-            import re
-            match = re.match(r'([UMTWRFS]+)\s+(.*)', unavail_str)
-            if not match:
-                continue
-                
-            day_codes, time_range = match.groups()
-            start_time, end_time = parse_time_range(time_range)
-            
-            if start_time and end_time:
-                for day_code in day_codes:
-                    day_name = {
-                        'U': 'Sunday',
-                        'M': 'Monday',
-                        'T': 'Tuesday',
-                        'W': 'Wednesday',
-                        'R': 'Thursday',
-                        'F': 'Friday',
-                        'S': 'Saturday'
-                    }.get(day_code.upper())
-                    
-                    if day_name:
-                        if day_name not in processed_unavailable:
-                            processed_unavailable[day_name] = []
-                        processed_unavailable[day_name].append((start_time, end_time))
+            for day_name, times in parse_unavailable_time(unavail_str).items():
+                if day_name not in processed_unavailable:
+                    processed_unavailable[day_name] = []
+                processed_unavailable[day_name].extend(times)
+        
+        # both fields can cover the same day, so merge overlapping ranges
+        processed_unavailable = {day: merge_time_ranges(times) for day, times in processed_unavailable.items()}
         
         # create worker object
         worker = {
-            "id": f"{first_name.lower()}_{last_name.lower()}_{len(workers)}",
+            "id": self._next_worker_id(),
             "first_name": first_name,
             "last_name": last_name,
             "email": email,
@@ -662,17 +944,24 @@ class WorkplaceSchedulerApp:
         # add worker to list
         workers.append(worker)
         
-        # save workers
-        save_json_data(workers_path, workers)
+        # save workers (written by the debounced flush)
+        self._save_workers(workers, defer=True)
         
-        # close window
-        window.destroy()
+        names.add(name_key)
+        
+        # hide window (kept around for the next worker)
+        window.withdraw()
         
         # show success message
         messagebox.showinfo("Success", f"Worker {first_name} {last_name} added successfully!")
         
-        # refresh view if on workers page
-        if hasattr(self, 'view_workers'):
+        # add just the new row if the workers list is open, otherwise show it
+        if self._workers_tree_shown():
+            self._insert_worker_row(worker)
+            self._update_worker_count()
+            self._page_versions["workers"] = self._workers_version()
+        else:
+            self._page_versions.pop("workers", None)
             self.view_workers()
     
     def import_workers_excel(self):
@@ -687,32 +976,27 @@ class WorkplaceSchedulerApp:
             return
         
         try:
-            # import workers
-            new_workers = import_workers_from_excel(file_path)
-            
             # load existing workers
-            workers_path = get_workers_path(self.base_dir, self.current_workplace)
-            existing_workers = load_json_data(workers_path, [])
+            existing_workers = list(self._get_workers())
             
-            # check for duplicates
-            existing_names = {(w["first_name"].lower(), w["last_name"].lower()) for w in existing_workers}
+            # check for duplicates (against a copy until the save succeeds)
+            existing_names = set(self._get_name_index())
             
-            added_count = 0
-            skipped_count = 0
+            # import workers, leaving out names that already exist
+            new_workers, skipped_count = import_workers_from_excel(file_path, existing_names)
             
-            for worker in new_workers:
-                name_key = (worker["first_name"].lower(), worker["last_name"].lower())
-                
-                if name_key in existing_names:
-                    skipped_count += 1
-                    continue
-                
-                existing_workers.append(worker)
-                existing_names.add(name_key)
-                added_count += 1
+            # give imported workers integer ids like manually added ones
+            next_id = self._next_worker_id()
+            for i, worker in enumerate(new_workers):
+                worker["id"] = next_id + i
+            
+            existing_workers.extend(new_workers)
+            existing_names.update(self._build_name_index(new_workers))
+            added_count = len(new_workers)
             
             # save workers
-            save_json_data(workers_path, existing_workers)
+            if self._save_workers(existing_workers):
+                self._name_index[self.current_workplace] = existing_names
             
             # show success message
             messagebox.showinfo(
@@ -729,8 +1013,7 @@ class WorkplaceSchedulerApp:
     def export_workers_excel(self):
         """Export workers to Excel file"""
         # load workers
-        workers_path = get_workers_path(self.base_dir, self.current_workplace)
-        workers = load_json_data(workers_path, [])
+        workers = self._get_workers()
         
         if not workers:
             messagebox.showinfo("Export", "No workers to export.")
@@ -761,8 +1044,7 @@ class WorkplaceSchedulerApp:
     def create_schedule(self):
         """Create a new schedule"""
         # load workers
-        workers_path = get_workers_path(self.base_dir, self.current_workplace)
-        workers = load_json_data(workers_path, [])
+        workers = self._get_workers()
         
         if not workers:
             messagebox.showinfo("Create Schedule", "No workers available to create a schedule.")
@@ -794,42 +1076,53 @@ class WorkplaceSchedulerApp:
         workers_frame = ttk.Frame(main_frame)
         workers_frame.pack(fill=tk.BOTH, expand=True)
         
-        # create scrollable frame
-        canvas = tk.Canvas(workers_frame)
-        scrollbar = ttk.Scrollbar(workers_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
+        # treeview only draws the visible rows, so large worker lists stay responsive
+        tree = ttk.Treeview(workers_frame, columns=("include", "name", "email", "work_study"), show="headings")
+        tree.heading("include", text="Include")
+        tree.heading("name", text="Name")
+        tree.heading("email", text="Email")
+        tree.heading("work_study", text="Work Study")
+        tree.column("include", width=70, anchor=tk.CENTER, stretch=False)
+        tree.column("name", width=200)
+        tree.column("email", width=300)
+        tree.column("work_study", width=100, anchor=tk.CENTER)
+        
+        scrollbar = ttk.Scrollbar(workers_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # add workers with checkboxes
+        # add workers, all included by default
         worker_vars = {}
+        display_names = self._get_display_names()
         
         for worker in workers:
-            worker_frame = ttk.Frame(scrollable_frame)
-            worker_frame.pack(fill=tk.X, pady=5)
-            
-            var = tk.BooleanVar(value=True)
-            worker_vars[worker["id"]] = var
-            
-            checkbox = ttk.Checkbutton(worker_frame, variable=var)
-            checkbox.pack(side=tk.LEFT)
-            
-            name = f"{worker['first_name']} {worker['last_name']}"
-            email = worker.get("email", "")
-            work_study = "Work Study" if worker.get("work_study", False) else ""
-            
-            ttk.Label(worker_frame, text=name, width=20).pack(side=tk.LEFT)
-            ttk.Label(worker_frame, text=email, width=30).pack(side=tk.LEFT)
-            ttk.Label(worker_frame, text=work_study, width=15).pack(side=tk.LEFT)
+            worker_vars[worker["id"]] = True
+            tree.insert("", "end", iid=str(worker["id"]), values=(
+                "☑",
+                display_names[worker["id"]],
+                worker.get("email", ""),
+                "Work Study" if worker.get("work_study", False) else ""
+            ))
+        
+        ids_by_iid = {str(worker_id): worker_id for worker_id in worker_vars}
+        
+        def set_included(iid, included):
+            worker_vars[ids_by_iid[iid]] = included
+            tree.set(iid, "include", "☑" if included else "☐")
+        
+        def toggle_row(event):
+            iid = tree.identify_row(event.y)
+            if iid and tree.identify_column(event.x) == "#1":
+                set_included(iid, not worker_vars[ids_by_iid[iid]])
+        
+        def toggle_selected(event):
+            for iid in tree.selection():
+                set_included(iid, not worker_vars[ids_by_iid[iid]])
+        
+        tree.bind("<Button-1>", toggle_row)
+        tree.bind("<space>", toggle_selected)
         
         # add buttons
         buttons_frame = ttk.Frame(main_frame)
@@ -838,8 +1131,8 @@ class WorkplaceSchedulerApp:
         select_all_var = tk.BooleanVar(value=True)
         
         def toggle_all():
-            for var in worker_vars.values():
-                var.set(select_all_var.get())
+            for iid in ids_by_iid:
+                set_included(iid, select_all_var.get())
         
         select_all_check = ttk.Checkbutton(
             buttons_frame, 
@@ -854,12 +1147,18 @@ class WorkplaceSchedulerApp:
             text="Create Schedule with Selected Workers",
             style="Action.TButton",
             command=lambda: self.generate_schedule(
-                {id: var.get() for id, var in worker_vars.items()},
+                dict(worker_vars),
                 schedule_window
             )
         )
         create_button.pack(side=tk.RIGHT)
     
+    def _get_generator(self):
+        """Create a schedule generator for the current workplace"""
+        # imported here so the scheduler module isn't loaded until it's needed
+        from scheduler import ScheduleGenerator
+        return ScheduleGenerator(self.base_dir, self.current_workplace)
+    
     def generate_schedule(self, worker_selections, window):
         """Generate a schedule with selected workers"""
         # get selected worker IDs
@@ -869,8 +1168,11 @@ class WorkplaceSchedulerApp:
             messagebox.showinfo("Create Schedule", "No workers selected. Please select at least one worker.")
             return
         
+        # the generator reads workers.json itself, so write pending edits first
+        self._flush_workers()
+        
         # create schedule generator
-        generator = ScheduleGenerator(self.base_dir, self.current_workplace)
+        generator = self._get_generator()
         
         # generate schedule
         schedule = generator.generate_schedule(selected_worker_ids)
@@ -905,114 +1207,127 @@ class WorkplaceSchedulerApp:
         notebook = ttk.Notebook(schedule_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
         
+        # load workers once for every shift dropdown
+        workers = self._get_workers()
+        display_names = self._get_display_names()
+        worker_names = ["UNASSIGNED"] + [display_names[w["id"]] for w in workers]
+        id_by_name = {display_names[w["id"]]: w["id"] for w in workers}
+        
         # add a tab for each day
         days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         day_frames = {}
+        pending_days = set(days)
         
-        for day in days:
-            day_frame = ttk.Frame(notebook)
-            notebook.add(day_frame, text=day)
-            day_frames[day] = day_frame
+        # tabs are filled in the first time they are shown
+        def populate_day(day):
+            if day not in pending_days:
+                return
+            pending_days.discard(day)
+            day_frame = day_frames[day]
             
             # add shifts for this day
             if day in schedule["days"]:
                 shifts = schedule["days"][day]
                 
-                # create shifts table
+                # one table per day, with the worker cell edited in place
                 shifts_frame = ttk.Frame(day_frame, padding=10)
                 shifts_frame.pack(fill=tk.BOTH, expand=True)
                 
-                # add header row
-                header_frame = ttk.Frame(shifts_frame)
-                header_frame.pack(fill=tk.X, pady=(0, 10))
+                shifts_tree = ttk.Treeview(
+                    shifts_frame,
+                    columns=("start", "end", "worker", "duration"),
+                    show="headings"
+                )
+                shifts_tree.heading("start", text="Start Time")
+                shifts_tree.heading("end", text="End Time")
+                shifts_tree.heading("worker", text="Worker")
+                shifts_tree.heading("duration", text="Duration")
+                shifts_tree.column("start", width=120, anchor=tk.CENTER)
+                shifts_tree.column("end", width=120, anchor=tk.CENTER)
+                shifts_tree.column("worker", width=250)
+                shifts_tree.column("duration", width=100, anchor=tk.CENTER)
                 
-                ttk.Label(header_frame, text="Start Time", width=15, font=("Arial", 12, "bold")).grid(row=0, column=0, padx=5)
-                ttk.Label(header_frame, text="End Time", width=15, font=("Arial", 12, "bold")).grid(row=0, column=1, padx=5)
-                ttk.Label(header_frame, text="Worker", width=30, font=("Arial", 12, "bold")).grid(row=0, column=2, padx=5)
-                ttk.Label(header_frame, text="Duration", width=10, font=("Arial", 12, "bold")).grid(row=0, column=3, padx=5)
+                shifts_scrollbar = ttk.Scrollbar(shifts_frame, orient="vertical", command=shifts_tree.yview)
+                shifts_tree.configure(yscrollcommand=shifts_scrollbar.set)
                 
-                # add separator
-                ttk.Separator(shifts_frame, orient="horizontal").pack(fill=tk.X, pady=(0, 10))
+                shifts_tree.pack(side="left", fill="both", expand=True)
+                shifts_scrollbar.pack(side="right", fill="y")
                 
-                # Add each shift
+                # add each shift, using its index as the row id
                 for i, shift in enumerate(shifts):
-                    shift_frame = ttk.Frame(shifts_frame)
-                    shift_frame.pack(fill=tk.X, pady=5)
-                    
-                    start_time = format_time_12hr(shift["start_time"])
-                    end_time = format_time_12hr(shift["end_time"])
-                    worker_name = shift["worker_name"]
-                    duration = f"{shift['duration_hours']:.2f} hrs"
-                    
-                    ttk.Label(shift_frame, text=start_time, width=15).grid(row=0, column=0, padx=5)
-                    ttk.Label(shift_frame, text=end_time, width=15).grid(row=0, column=1, padx=5)
-                    
-                    # create worker selection dropdown
-                    worker_var = tk.StringVar(value=worker_name)
-                    
-                    # get all workers
-                    workers_path = get_workers_path(self.base_dir, self.current_workplace)
-                    workers = load_json_data(workers_path, [])
-                    
-                    # create list of worker names
-                    worker_names = ["UNASSIGNED"] + [f"{w['first_name']} {w['last_name']}" for w in workers]
-                    
-                    worker_dropdown = ttk.Combobox(shift_frame, textvariable=worker_var, values=worker_names, width=30)
-                    worker_dropdown.grid(row=0, column=2, padx=5)
-                    
-                    # update shift when worker changes
-                    def update_worker(event, day=day, shift_index=i, var=worker_var):
-                        new_worker_name = var.get()
-                        
-                        if new_worker_name == "UNASSIGNED":
-                            schedule["days"][day][shift_index]["worker_id"] = None
-                            schedule["days"][day][shift_index]["worker_name"] = "UNASSIGNED"
-                        else:
-                            # find worker by name
-                            for worker in workers:
-                                if f"{worker['first_name']} {worker['last_name']}" == new_worker_name:
-                                    schedule["days"][day][shift_index]["worker_id"] = worker["id"]
-                                    schedule["days"][day][shift_index]["worker_name"] = new_worker_name
-                                    break
-                        
-                        # update worker summary
-                        self.update_worker_summary(schedule)
-                    
-                    worker_dropdown.bind("<<ComboboxSelected>>", update_worker)
+                    shifts_tree.insert("", "end", iid=str(i), values=(
+                        format_time_12hr(shift["start_time"]),
+                        format_time_12hr(shift["end_time"]),
+                        shift["worker_name"],
+                        f"{shift['duration_hours']:.2f} hrs"
+                    ))
+                
+                # update shift when worker changes
+                def update_worker(iid, new_worker_name, day=day):
+                    shift = schedule["days"][day][int(iid)]
+                    old_worker_id = shift["worker_id"]
                     
-                    ttk.Label(shift_frame, text=duration, width=10).grid(row=0, column=3, padx=5)
+                    if new_worker_name == "UNASSIGNED":
+                        shift["worker_id"] = None
+                        shift["worker_name"] = "UNASSIGNED"
+                    elif new_worker_name in id_by_name:
+                        shift["worker_id"] = id_by_name[new_worker_name]
+                        shift["worker_name"] = new_worker_name
                     
-                    # add separator after each shift except the last one
-                    if i < len(shifts) - 1:
-                        ttk.Separator(shifts_frame, orient="horizontal").pack(fill=tk.X, pady=(5, 0))
+                    # only the previous and new worker's hours change
+                    self.update_worker_summary(schedule, summary_tree, {old_worker_id, shift["worker_id"]})
+                
+                def edit_worker(event, tree=shifts_tree, update_worker=update_worker):
+                    column = tree.identify_column(event.x)
+                    if column and tree.column(column, "id") == "worker":
+                        self._edit_tree_cell(
+                            tree, tree.identify_row(event.y), column,
+                            values=worker_names, on_change=update_worker
+                        )
+                
+                shifts_tree.bind("<Double-1>", edit_worker)
             else:
                 # no shifts for this day
                 ttk.Label(day_frame, text="No shifts scheduled for this day.", padding=20).pack()
         
+        for day in days:
+            day_frames[day] = ttk.Frame(notebook)
+            notebook.add(day_frames[day], text=day)
+        
         # add worker summary
         summary_frame = ttk.Frame(main_frame)
         summary_frame.pack(fill=tk.X, pady=(20, 0))
         
         ttk.Label(summary_frame, text="Worker Summary", style="Subtitle.TLabel").pack(anchor=tk.W, pady=(0, 10))
         
-        # create scrollable frame for worker summary
-        summary_canvas = tk.Canvas(summary_frame, height=150)
-        summary_scrollbar = ttk.Scrollbar(summary_frame, orient="vertical", command=summary_canvas.yview)
-        summary_scrollable_frame = ttk.Frame(summary_canvas)
-        
-        summary_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: summary_canvas.configure(scrollregion=summary_canvas.bbox("all"))
+        # rows are created once and updated in place as shifts change
+        summary_tree = ttk.Treeview(
+            summary_frame,
+            columns=("name", "work_study", "weekly_hours", "status"),
+            show="headings",
+            height=6
         )
-        
-        summary_canvas.create_window((0, 0), window=summary_scrollable_frame, anchor="nw")
-        summary_canvas.configure(yscrollcommand=summary_scrollbar.set)
-        
-        summary_canvas.pack(side="left", fill="x", expand=True)
+        summary_tree.heading("name", text="Name")
+        summary_tree.heading("work_study", text="Work Study")
+        summary_tree.heading("weekly_hours", text="Weekly Hours")
+        summary_tree.heading("status", text="Status")
+        summary_tree.column("name", width=250)
+        summary_tree.column("work_study", width=100, anchor=tk.CENTER)
+        summary_tree.column("weekly_hours", width=100, anchor=tk.CENTER)
+        summary_tree.column("status", width=200)
+        
+        summary_scrollbar = ttk.Scrollbar(summary_frame, orient="vertical", command=summary_tree.yview)
+        summary_tree.configure(yscrollcommand=summary_scrollbar.set)
+        
+        summary_tree.pack(side="left", fill="x", expand=True)
         summary_scrollbar.pack(side="right", fill="y")
         
         # add worker summary
-        self.update_worker_summary(schedule, summary_scrollable_frame)
+        self.update_worker_summary(schedule, summary_tree)
+        
+        # build the selected day now and the others on demand
+        notebook.bind("<<NotebookTabChanged>>", lambda e: populate_day(notebook.tab(notebook.select(), "text")))
+        populate_day(notebook.tab(notebook.select(), "text"))
         
         # add buttons
         buttons_frame = ttk.Frame(main_frame)
@@ -1026,86 +1341,99 @@ class WorkplaceSchedulerApp:
         )
         save_button.pack(side=tk.RIGHT)
     
-    def update_worker_summary(self, schedule, frame=None):
-        """Update worker summary in schedule editor"""
-        # calculate hours for each worker
-        worker_hours = {}
+    def update_worker_summary(self, schedule, tree=None, worker_ids=None):
+        """Update worker summary in schedule editor.
         
-        for day, shifts in schedule["days"].items():
+        When worker_ids is given, only those workers are recounted and redrawn.
+        """
+        # calculate hours for each worker in one pass
+        worker_hours = defaultdict(float)
+        
+        for shifts in schedule["days"].values():
             for shift in shifts:
                 worker_id = shift["worker_id"]
-                if worker_id:
-                    if worker_id not in worker_hours:
-                        worker_hours[worker_id] = 0
+                if worker_id is not None and (worker_ids is None or worker_id in worker_ids):
                     worker_hours[worker_id] += shift["duration_hours"]
         
         # update worker summary in schedule
-        for worker in schedule["workers"]:
+        if worker_ids is None:
+            workers = schedule["workers"]
+        else:
+            workers = [w for w in schedule["workers"] if w["id"] in worker_ids]
+        
+        for worker in workers:
             worker["weekly_hours"] = worker_hours.get(worker["id"], 0)
         
-        # update UI if frame is provided
-        if frame:
-            # clear frame
-            for widget in frame.winfo_children():
-                widget.destroy()
-            
-            # add header row
-            header_frame = ttk.Frame(frame)
-            header_frame.pack(fill=tk.X, pady=(0, 10))
-            
-            ttk.Label(header_frame, text="Name", width=30, font=("Arial", 12, "bold")).grid(row=0, column=0, padx=5)
-            ttk.Label(header_frame, text="Work Study", width=15, font=("Arial", 12, "bold")).grid(row=0, column=1, padx=5)
-            ttk.Label(header_frame, text="Weekly Hours", width=15, font=("Arial", 12, "bold")).grid(row=0, column=2, padx=5)
-            ttk.Label(header_frame, text="Status", width=20, font=("Arial", 12, "bold")).grid(row=0, column=3, padx=5)
-            
-            # add separator
-            ttk.Separator(frame, orient="horizontal").pack(fill=tk.X, pady=(0, 10))
+        # update UI if the summary is provided
+        if tree is None or not tree.winfo_exists():
+            return
+        
+        # rows are added sorted by name the first time, then only their values change
+        if not tree.get_children():
+            for worker in sorted(schedule["workers"], key=lambda w: w["name"]):
+                tree.insert("", "end", iid=str(worker["id"]))
+        
+        for worker in workers:
+            # determine status
+            status = ""
+            if worker["work_study"]:
+                if worker["weekly_hours"] < 5:
+                    status = f"Needs {5 - worker['weekly_hours']:.2f} more hours"
+                elif worker["weekly_hours"] > 5:
+                    status = f"{worker['weekly_hours'] - 5:.2f} hours over limit"
+                else:
+                    status = "Perfect (5 hours)"
             
-            # add each worker
-            for i, worker in enumerate(sorted(schedule["workers"], key=lambda w: w["name"])):
-                worker_frame = ttk.Frame(frame)
-                worker_frame.pack(fill=tk.X, pady=5)
-                
-                name = worker["name"]
-                work_study = "Yes" if worker["work_study"] else "No"
-                hours = f"{worker['weekly_hours']:.2f}"
-                
-                # determine status
-                status = ""
-                if worker["work_study"]:
-                    if worker["weekly_hours"] < 5:
-                        status = f"Needs {5 - worker['weekly_hours']:.2f} more hours"
-                    elif worker["weekly_hours"] > 5:
-                        status = f"{worker['weekly_hours'] - 5:.2f} hours over limit"
-                    else:
-                        status = "Perfect (5 hours)"
-                
-                ttk.Label(worker_frame, text=name, width=30).grid(row=0, column=0, padx=5)
-                ttk.Label(worker_frame, text=work_study, width=15).grid(row=0, column=1, padx=5)
-                ttk.Label(worker_frame, text=hours, width=15).grid(row=0, column=2, padx=5)
-                ttk.Label(worker_frame, text=status, width=20).grid(row=0, column=3, padx=5)
-                
-                # add separator after each worker except the last one
-                if i < len(schedule["workers"]) - 1:
-                    ttk.Separator(frame, orient="horizontal").pack(fill=tk.X, pady=(5, 0))
+            tree.item(str(worker["id"]), values=(
+                worker["name"],
+                "Yes" if worker["work_study"] else "No",
+                f"{worker['weekly_hours']:.2f}",
+                status
+            ))
     
     def save_schedule(self, schedule, window):
         """Save the schedule"""
+        self._flush_workers()
+        self._replacement_cache.clear()
+        
         # create schedule generator
-        generator = ScheduleGenerator(self.base_dir, self.current_workplace)
+        generator = self._get_generator()
         
         # save schedule
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"schedule_{timestamp}.json"
         schedule_path = generator.save_schedule(schedule, filename)
         
-        # export to Excel
+        # export to Excel in the background and check back until it is done
         excel_path = os.path.join(generator.schedules_path, f"schedule_{timestamp}.xlsx")
-        generator.export_schedule_to_excel(schedule, excel_path)
+        future = _IO_POOL.submit(generator.export_schedule_to_excel, schedule, excel_path)
         
         # close window
         window.destroy()
         
+        def check_export():
+            if future.done():
+                self._on_export_done(future, excel_path, schedule_path)
+            else:
+                self.root.after(100, check_export)
+        
+        check_export()
+    
+    def _on_export_done(self, future, excel_path, schedule_path):
+        """Report a finished schedule export and offer to open it"""
+        try:
+            exported = future.result()
+        except Exception as e:
+            print(f"Error exporting schedule to Excel: {e}")
+            exported = False
+        
+        if not exported:
+            messagebox.showwarning(
+                "Schedule Created",
+                f"Schedule saved to: {os.path.basename(schedule_path)}\n\nThe Excel export failed."
+            )
+            return
+        
         # show success message
         messagebox.showinfo(
             "Schedule Created",
@@ -1220,7 +1548,6 @@ class WorkplaceSchedulerApp:
             return
         
         # parse time range
-        from utils import convert_time_to_24hr
         start_time_24hr = convert_time_to_24hr(start_time)
         end_time_24hr = convert_time_to_24hr(end_time)
         
@@ -1228,11 +1555,23 @@ class WorkplaceSchedulerApp:
             ttk.Label(results_frame, text="Invalid time format. Please use format like '2pm' or '2:00 PM'.").pack(pady=20)
             return
         
-        # create schedule generator
-        generator = ScheduleGenerator(self.base_dir, self.current_workplace)
+        self._flush_workers()
         
-        # find available workers
-        available_workers = generator.find_replacement_workers(day, start_time_24hr, end_time_24hr)
+        # repeat searches reuse the last result until workers.json changes
+        try:
+            mtime = os.stat(get_workers_path(self.base_dir, self.current_workplace)).st_mtime_ns
+        except OSError:
+            mtime = None
+        key = (self.current_workplace, day, start_time_24hr, end_time_24hr, mtime)
+        
+        available_workers = self._replacement_cache.get(key)
+        if available_workers is None:
+            # create schedule generator
+            generator = self._get_generator()
+            
+            # find available workers
+            available_workers = generator.find_replacement_workers(day, start_time_24hr, end_time_24hr)
+            self._replacement_cache[key] = available_workers
         
         # show results
         ttk.Label(
@@ -1245,52 +1584,33 @@ class WorkplaceSchedulerApp:
             ttk.Label(results_frame, text="No workers available for this shift.").pack(pady=20)
             return
         
-        # create scrollable frame
-        canvas = tk.Canvas(results_frame)
-        scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
+        # list workers in a treeview, which only draws the rows in view
+        columns = ("name", "email", "work_study", "weekly_hours")
+        tree = ttk.Treeview(results_frame, columns=columns, show="headings")
+        tree.heading("name", text="Name")
+        tree.heading("email", text="Email")
+        tree.heading("work_study", text="Work Study")
+        tree.heading("weekly_hours", text="Weekly Hours")
+        tree.column("name", width=200)
+        tree.column("email", width=250)
+        tree.column("work_study", width=100, anchor=tk.CENTER)
+        tree.column("weekly_hours", width=100, anchor=tk.CENTER)
+        
+        scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # add header row
-        header_frame = ttk.Frame(scrollable_frame)
-        header_frame.pack(fill=tk.X, pady=(0, 10))
-        
-        ttk.Label(header_frame, text="Name", width=30, font=("Arial", 12, "bold")).grid(row=0, column=0, padx=5)
-        ttk.Label(header_frame, text="Email", width=30, font=("Arial", 12, "bold")).grid(row=0, column=1, padx=5)
-        ttk.Label(header_frame, text="Work Study", width=15, font=("Arial", 12, "bold")).grid(row=0, column=2, padx=5)
-        ttk.Label(header_frame, text="Weekly Hours", width=15, font=("Arial", 12, "bold")).grid(row=0, column=3, padx=5)
-        
-        # add separator
-        ttk.Separator(scrollable_frame, orient="horizontal").pack(fill=tk.X, pady=(0, 10))
-        
-        # add each worker
-        for i, worker in enumerate(available_workers):
-            worker_frame = ttk.Frame(scrollable_frame)
-            worker_frame.pack(fill=tk.X, pady=5)
-            
-            name = f"{worker['first_name']} {worker['last_name']}"
-            email = worker.get("email", "")
-            work_study = "Yes" if worker.get("work_study", False) else "No"
-            hours = f"{worker.get('weekly_hours', 0):.2f}"
-            
-            ttk.Label(worker_frame, text=name, width=30).grid(row=0, column=0, padx=5)
-            ttk.Label(worker_frame, text=email, width=30).grid(row=0, column=1, padx=5)
-            ttk.Label(worker_frame, text=work_study, width=15).grid(row=0, column=2, padx=5)
-            ttk.Label(worker_frame, text=hours, width=15).grid(row=0, column=3, padx=5)
-            
-            # add separator after each worker except the last one
-            if i < len(available_workers) - 1:
-                ttk.Separator(scrollable_frame, orient="horizontal").pack(fill=tk.X, pady=(5, 0))
+        # add each worker, using names already formatted for this workplace
+        display_names = self._get_display_names()
+        for worker in available_workers:
+            tree.insert("", "end", values=(
+                display_names.get(worker["id"]) or f"{worker['first_name']} {worker['last_name']}",
+                worker.get("email", ""),
+                "Yes" if worker.get("work_study", False) else "No",
+                f"{worker.get('weekly_hours', 0):.2f}"
+            ))
     
     def backup_data(self):
         """Backup all data"""
@@ -1304,13 +1624,88 @@ class WorkplaceSchedulerApp:
         if not file_path:
             return
         
-        # create backup
-        success = backup_data(self.base_dir, file_path.replace(".zip", ""))
+        def done(success):
+            if success:
+                messagebox.showinfo("Backup Complete", f"Data backed up successfully to {file_path}")
+            else:
+                messagebox.showerror("Backup Error", "An error occurred while creating the backup.")
         
-        if success:
-            messagebox.showinfo("Backup Complete", f"Data backed up successfully to {file_path}")
-        else:
-            messagebox.showerror("Backup Error", "An error occurred while creating the backup.")
+        # create backup (including edits not yet flushed to disk)
+        self._flush_workers()
+        self._run_with_progress(
+            "Backup", "Backing up data...", done,
+            backup_data, self.base_dir, file_path.replace(".zip", "")
+        )
+    
+    def _run_with_progress(self, title, message, on_done, func, *args):
+        """Run func(*args) on the I/O pool behind a progress dialog, then call on_done(result)"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        
+        # the dialog can't be closed and blocks the rest of the app until the work is done
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        frame = ttk.Frame(dialog, padding=20)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(frame, text=message).pack(anchor=tk.W, pady=(0, 10))
+        progress = ttk.Progressbar(frame, mode="indeterminate", length=250)
+        progress.pack()
+        progress.start(50)
+        dialog.grab_set()
+        
+        future = _IO_POOL.submit(func, *args)
+        
+        def check():
+            if not future.done():
+                self.root.after(100, check)
+                return
+            
+            progress.stop()
+            dialog.grab_release()
+            dialog.destroy()
+            
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error during {title.lower()}: {e}")
+                result = False
+            on_done(result)
+        
+        check()
+    
+    def _reload_state(self):
+        """Drop everything read from disk and show the dashboard again"""
+        clear_json_cache()
+        
+        # reload settings
+        self.settings = load_json_data(self.settings_path, {"email": ""})
+        self.current_workplace = None
+        
+        # forget cached workers
+        self._replacement_cache.clear()
+        self._workers_cache.clear()
+        self._workers_mtime.clear()
+        self._name_index.clear()
+        self._workers_by_id.clear()
+        self._display_names.clear()
+        
+        # close other windows, including pooled ones, since they show old data
+        self._cell_edit = None
+        for widget in self.root.winfo_children():
+            if isinstance(widget, tk.Toplevel):
+                widget.destroy()
+        
+        # rebuild pages from scratch
+        for page in self._pages.values():
+            page.destroy()
+        self._pages.clear()
+        self._page_versions.clear()
+        self._current_page = None
+        
+        self.show_dashboard()
     
     def restore_data(self):
         """Restore data from backup"""
@@ -1332,17 +1727,21 @@ class WorkplaceSchedulerApp:
         if not result:
             return
         
-        # restore backup
-        success = restore_data(self.base_dir, file_path)
+        # the backup replaces all data, so drop edits that haven't been written
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._dirty_workplaces.clear()
         
-        if success:
-            messagebox.showinfo("Restore Complete", "Data restored successfully. The application will now restart.")
-            
-            # restart application
-            python = sys.executable
-            os.execl(python, python, *sys.argv)
-        else:
-            messagebox.showerror("Restore Error", "An error occurred while restoring from backup.")
+        def done(success):
+            if success:
+                messagebox.showinfo("Restore Complete", "Data restored successfully. The application will now reload its data.")
+                self._reload_state()
+            else:
+                messagebox.showerror("Restore Error", "An error occurred while restoring from backup.")
+        
+        # restore backup
+        self._run_with_progress("Restore", "Restoring data...", done, restore_data, self.base_dir, file_path)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,15 +1,21 @@
 import os
 import json
-import pandas as pd
 import random
+import heapq
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from utils import (
-    load_json_data, save_json_data, 
-    parse_time_range, time_to_minutes, minutes_to_time,
+    load_json_data_cached, save_json_data, 
+    parse_time_range, time_to_minutes, format_minutes_12hr,
     calculate_shift_duration, calculate_shift_duration_hours,
-    is_worker_available, get_available_workers
+    availability_minutes, is_available_in_minutes, get_available_workers, DAY_NAMES
 )
 
+def _generate_workplace_schedule(base_dir, workplace_name, selected_worker_ids=None):
+    """Generate one workplace's schedule (module level so worker processes can run it)"""
+    return ScheduleGenerator(base_dir, workplace_name).generate_schedule(selected_worker_ids)
+
 class ScheduleGenerator:
     def __init__(self, base_dir, workplace_name):
         self.base_dir = base_dir
@@ -19,13 +25,38 @@ class ScheduleGenerator:
         self.workers_path = os.path.join(self.workplace_path, "workers", "workers.json")
         self.schedules_path = os.path.join(self.workplace_path, "schedules")
         
-        # load configuration
-        self.config = load_json_data(self.config_path, {})
-        self.workers = load_json_data(self.workers_path, [])
+        # load configuration (parsed files are shared, so workers get their own copies)
+        self.config = load_json_data_cached(self.config_path, {})
+        self.workers = [dict(w) for w in load_json_data_cached(self.workers_path, [])]
         
-        # reset weekly hours for all workers
+        # reset weekly hours for all workers and convert their times to minutes once
         for worker in self.workers:
             worker["weekly_hours"] = 0
+            worker["_avail_mins"], worker["_unavail_mins"] = availability_minutes(worker)
+            
+            # one bit per weekday the worker has any availability, for quick rejects
+            worker["_day_mask"] = 0
+            for i, day in enumerate(DAY_NAMES):
+                starts, _ = worker["_avail_mins"].get(day, ([], []))
+                if starts:
+                    worker["_day_mask"] |= 1 << i
+    
+    @classmethod
+    def generate_for_workplaces(cls, base_dir, workplace_names):
+        """Generate schedules for several workplaces at once, returning {name: schedule}
+        
+        Workplaces share nothing, so each one is generated in its own process.
+        """
+        workplace_names = list(workplace_names)
+        if len(workplace_names) < 2:
+            return {name: cls(base_dir, name).generate_schedule() for name in workplace_names}
+        
+        with ProcessPoolExecutor(max_workers=min(len(workplace_names), os.cpu_count() or 1)) as pool:
+            futures = {
+                name: pool.submit(_generate_workplace_schedule, base_dir, name)
+                for name in workplace_names
+            }
+            return {name: future.result() for name, future in futures.items()}
     
     def generate_schedule(self, selected_worker_ids=None):
         """Generate a schedule based on worker availability and shift requirements"""
@@ -53,6 +84,23 @@ class ScheduleGenerator:
             day_shifts = []
             assigned_workers = set()  # track workers already assigned for this day
             
+            # priority queues for the day: work study workers under 5 hours come first,
+            # then everyone else, each ordered by weekly hours (ties keep the list order);
+            # workers with no availability at all that day are left out
+            day_bit = 1 << DAY_NAMES.index(day)
+            work_study_heap = []
+            other_heap = []
+            for index, worker in enumerate(selected_workers):
+                if not worker["_day_mask"] & day_bit:
+                    continue
+                entry = (worker["weekly_hours"], index, worker)
+                if worker["work_study"] and worker["weekly_hours"] < 5:
+                    work_study_heap.append(entry)
+                else:
+                    other_heap.append(entry)
+            heapq.heapify(work_study_heap)
+            heapq.heapify(other_heap)
+            
             # process each shift for this day
             for shift_time_str in shift_times[day]:
                 start_time, end_time = parse_time_range(shift_time_str)
@@ -61,32 +109,31 @@ class ScheduleGenerator:
                 
                 # calculate shift duration
                 duration_hours = calculate_shift_duration_hours(start_time, end_time)
+                start_mins = time_to_minutes(start_time)
+                end_mins = time_to_minutes(end_time)
                 
-                # find available workers for this shift
-                available_workers = [
-                    w for w in selected_workers 
-                    if w["id"] not in assigned_workers and is_worker_available(w, day, start_time, end_time)
-                ]
-                
-                # sorts workers by priority
-                # Work study workers with less than 5 hours get priority
-                # then non-work study workers
-                work_study_workers = [w for w in available_workers if w["work_study"] and w["weekly_hours"] < 5]
-                other_workers = [w for w in available_workers if not w["work_study"] or w["weekly_hours"] >= 5]
-                
-                # sort work study workers by current weekly hours (ascending)
-                work_study_workers.sort(key=lambda w: w["weekly_hours"])
-                
-                # sort other workers by current weekly hours (ascending)
-                other_workers.sort(key=lambda w: w["weekly_hours"])
-                
-                # combine sorted lists
-                sorted_workers = work_study_workers + other_workers
+                # take the first available worker in priority order; workers who can't
+                # make this shift go back on their heap for the day's later shifts
+                assigned_worker = None
+                for heap in (work_study_heap, other_heap):
+                    skipped = []
+                    while heap:
+                        entry = heapq.heappop(heap)
+                        worker = entry[2]
+                        if worker["id"] in assigned_workers:
+                            # another entry with this id was already assigned today
+                            continue
+                        if is_available_in_minutes(worker["_avail_mins"], worker["_unavail_mins"], day, start_mins, end_mins):
+                            assigned_worker = worker
+                            break
+                        skipped.append(entry)
+                    for entry in skipped:
+                        heapq.heappush(heap, entry)
+                    if assigned_worker is not None:
+                        break
                 
                 # assign worker to shift if available
-                if sorted_workers:
-                    assigned_worker = sorted_workers[0]
-                    
+                if assigned_worker is not None:
                     # add shift to schedule
                     shift = {
                         "start_time": start_time,
@@ -101,7 +148,7 @@ class ScheduleGenerator:
                     # update worker's weekly hours
                     assigned_worker["weekly_hours"] += duration_hours
                     
-                    # add worker to assigned set for this day
+                    # add worker to assigned set for this day (it stays off the heaps until tomorrow)
                     assigned_workers.add(assigned_worker["id"])
                 else:
                     # no available worker for this shift
@@ -148,65 +195,45 @@ class ScheduleGenerator:
     
     def export_schedule_to_excel(self, schedule, file_path):
         """Export schedule to Excel format"""
+        # pandas is slow to import, so only load it when exporting
+        import pandas as pd
+        
         try:
             # create a DataFrame for the schedule
             days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            hours = []
             
-            # find all unique hours across all days
+            # find all shift boundaries across all days, in minutes
+            boundaries = set()
             for day in days:
                 if day in schedule["days"]:
                     for shift in schedule["days"][day]:
                         start_time = shift["start_time"]
                         end_time = shift["end_time"]
-                        if start_time and end_time and start_time not in hours:
-                            hours.append(start_time)
-                        if end_time and end_time not in hours:
-                            hours.append(end_time)
-            
-            # sort hours
-            hours = sorted(hours, key=lambda x: time_to_minutes(x))
-            
-            # create time slots (30-minute increments)
-            time_slots = []
-            for i in range(len(hours) - 1):
-                start_mins = time_to_minutes(hours[i])
-                end_mins = time_to_minutes(hours[i+1])
-                
-                # add 30-minute slots
-                current_mins = start_mins
-                while current_mins < end_mins:
-                    time_slots.append(minutes_to_time(current_mins))
-                    current_mins += 30
-            
-            # add the last hour
-            time_slots.append(hours[-1])
+                        if start_time and end_time:
+                            boundaries.add(time_to_minutes(start_time))
+                        if end_time:
+                            boundaries.add(time_to_minutes(end_time))
+            boundaries = sorted(boundaries)
             
-            # remove duplicates and sort
-            time_slots = sorted(set(time_slots), key=lambda x: time_to_minutes(x))
+            # create time slots (30-minute increments from each boundary to the next, plus the last one)
+            slot_mins = {boundaries[-1]}
+            for start_mins, end_mins in zip(boundaries, boundaries[1:]):
+                slot_mins.update(range(start_mins, end_mins, 30))
+            slot_mins = sorted(slot_mins)
             
-            # create DataFrame
-            df = pd.DataFrame(index=time_slots, columns=days)
-            
-            # fill in schedule data
-            for day in days:
+            # fill in schedule data as plain rows; the slots covered by a shift
+            # are the ones from its start up to (not including) its end
+            grid = [[None] * len(days) for _ in slot_mins]
+            for column, day in enumerate(days):
                 if day in schedule["days"]:
                     for shift in schedule["days"][day]:
-                        start_time = shift["start_time"]
-                        end_time = shift["end_time"]
-                        worker_name = shift["worker_name"]
-                        
-                        # find all time slots that fall within this shift
-                        for slot in time_slots:
-                            slot_mins = time_to_minutes(slot)
-                            start_mins = time_to_minutes(start_time)
-                            end_mins = time_to_minutes(end_time)
-                            
-                            if start_mins <= slot_mins < end_mins:
-                                df.at[slot, day] = worker_name
+                        first = bisect_left(slot_mins, time_to_minutes(shift["start_time"]))
+                        last = bisect_left(slot_mins, time_to_minutes(shift["end_time"]))
+                        for row in range(first, last):
+                            grid[row][column] = shift["worker_name"]
             
-            # format the index to be more readable
-            df.index = [self._format_time_for_display(t) for t in df.index]
+            # create DataFrame, labelling rows with readable 12-hour times
+            df = pd.DataFrame(grid, index=[format_minutes_12hr(mins) for mins in slot_mins], columns=days)
             
             # add worker summary
             worker_summary = pd.DataFrame([
@@ -219,8 +246,18 @@ class ScheduleGenerator:
                 for w in schedule["workers"]
             ])
             
+            # xlsxwriter writes values-only workbooks faster than openpyxl, so use it when installed
+            # (skipping its per-cell URL detection, since cells are only names and emails)
+            try:
+                import xlsxwriter
+                engine = "xlsxwriter"
+                engine_kwargs = {"options": {"strings_to_urls": False}}
+            except ImportError:
+                engine = None
+                engine_kwargs = None
+            
             # save to Excel with multiple sheets
-            with pd.ExcelWriter(file_path) as writer:
+            with pd.ExcelWriter(file_path, engine=engine, engine_kwargs=engine_kwargs) as writer:
                 df.to_excel(writer, sheet_name="Schedule")
                 worker_summary.to_excel(writer, sheet_name="Worker Summary", index=False)
             
@@ -229,24 +266,6 @@ class ScheduleGenerator:
             print(f"Error exporting schedule to Excel: {e}")
             return False
     
-    def _format_time_for_display(self, time_str):
-        """Format time string for display in Excel"""
-        if not time_str:
-            return ""
-        
-        try:
-            hours, minutes = map(int, time_str.split(':'))
-            
-            # convert to 12-hour format
-            period = "AM" if hours < 12 else "PM"
-            hours = hours % 12
-            if hours == 0:
-                hours = 12
-                
-            return f"{hours}:{minutes:02d} {period}"
-        except:
-            return time_str
-    
     def find_replacement_workers(self, day, start_time, end_time):
         """Find workers available for a specific shift (for last-minute replacements)"""
         # convert day name to proper format if needed
@@ -264,18 +283,9 @@ class ScheduleGenerator:
         # find available workers
         available_workers = get_available_workers(self.workers, day, start_time, end_time)
         
-        # sort by work study status and weekly hours
-        work_study_workers = [w for w in available_workers if w["work_study"] and w["weekly_hours"] < 5]
-        other_workers = [w for w in available_workers if not w["work_study"] or w["weekly_hours"] >= 5]
-        
-        # sort work study workers by current weekly hours (ascending)
-        work_study_workers.sort(key=lambda w: w["weekly_hours"])
-        
-        # sort other workers by current weekly hours (ascending)
-        other_workers.sort(key=lambda w: w["weekly_hours"])
-        
-        # combine sorted lists
-        sorted_workers = work_study_workers + other_workers
-        
-        return sorted_workers
+        # work study workers under 5 hours come first, then everyone else, each by weekly hours
+        return sorted(
+            available_workers,
+            key=lambda w: (not (w["work_study"] and w["weekly_hours"] < 5), w["weekly_hours"])
+        )
       
@@ -1,48 +1,80 @@
 import os
 import json
-import datetime
-import pandas as pd
-from datetime import datetime, timedelta
+import mmap
 import re
+import shutil
+import zipfile
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
 
-# time conversion functions
+# orjson is optional; it encodes JSON in C and is much faster than json for large rosters
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 12-hour times like '2pm', '2:00 PM' or '2:00 p.m.'
+TIME_12HR_RE = re.compile(r'(\d{1,2})(?::(\d{1,2}))?\s*([ap])\.?m\.?$', re.IGNORECASE)
+
+# unavailable time strings look like 'MWF 1pm - 2pm'
+UNAVAILABLE_RE = re.compile(r'([UMTWRFS]+)\s+(.*)')
+
+# files at least this big are parsed straight from a memory map
+MMAP_MIN_SIZE = 64 * 1024
+
+# one time range inside an availability string, like '12pm - 8pm' or '2:00 PM-5:00 PM'
+TIME_RANGE_RE = re.compile(
+    r'(\d{1,2}(?::\d{2})?\s*(?:[ap]m)?)\s*-\s*(\d{1,2}(?::\d{2})?\s*(?:[ap]m)?)',
+    re.IGNORECASE
+)
+
+# day names in day-code order, and a byte table turning a day code into its index
+DAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+DAY_INDEX_TABLE = bytes.maketrans(b"UMTWRFSumtwrfs", bytes(range(7)) * 2)
+
+# day codes used in availability strings
+DAY_CODES = {
+    'U': 'Sunday',
+    'M': 'Monday',
+    'T': 'Tuesday',
+    'W': 'Wednesday',
+    'R': 'Thursday',
+    'F': 'Friday',
+    'S': 'Saturday'
+}
+
+# time conversion functions, memoized since they only ever see a handful of distinct strings
+@lru_cache(maxsize=2048)
 def convert_time_to_24hr(time_str):
     """Convert time string like '2:00 PM' to 24-hour format (14:00)"""
-    if time_str.lower() == 'na' or not time_str:
+    if not time_str or time_str.lower() == 'na':
         return None
     
-    try:
-        # handle various time formats
-        if ' - ' in time_str:
-            # if it's a range, just get the first part
-            time_str = time_str.split(' - ')[0]
-        
-        # remove any non-time characters
-        time_str = time_str.strip()
-        
-        # parse the time
-        if 'am' in time_str.lower() or 'pm' in time_str.lower():
-            # format like "2pm" or "2:00pm"
-            time_str = time_str.lower().replace('am', ' AM').replace('pm', ' PM')
-            time_str = time_str.replace('a.m.', ' AM').replace('p.m.', ' PM')
-            
-            # handle formats without a colon
-            if ':' not in time_str and any(c.isdigit() for c in time_str):
-                # extract the number part
-                num_part = ''.join(c for c in time_str if c.isdigit())
-                am_pm = 'AM' if 'am' in time_str.lower() else 'PM'
-                time_str = f"{num_part}:00 {am_pm}"
-            
-            # parse with datetime
-            time_obj = datetime.strptime(time_str, '%I:%M %p')
-            return time_obj.strftime('%H:%M')
-        else:
-            # assume 24-hour format already
-            return time_str
-    except Exception as e:
-        print(f"Error converting time '{time_str}': {e}")
-        return None
+    # handle various time formats
+    if ' - ' in time_str:
+        # if it's a range, just get the first part
+        time_str = time_str.split(' - ')[0]
+    
+    # remove any non-time characters
+    time_str = time_str.strip()
+    
+    match = TIME_12HR_RE.match(time_str)
+    if match:
+        hours, minutes, period = match.groups()
+        hours = int(hours)
+        minutes = int(minutes or 0)
+        if 1 <= hours <= 12 and minutes < 60:
+            hours = hours % 12 + (12 if period.lower() == 'p' else 0)
+            return f"{hours:02d}:{minutes:02d}"
+    elif 'am' not in time_str.lower() and 'pm' not in time_str.lower():
+        # assume 24-hour format already
+        return time_str
+    
+    print(f"Error converting time '{time_str}': not a valid 12-hour time")
+    return None
 
+@lru_cache(maxsize=2048)
 def parse_time_range(time_range):
     """Parse a time range like '2:00 PM - 5:00 PM' into start and end times in 24hr format"""
     if not time_range or time_range.lower() == 'na':
@@ -61,6 +93,7 @@ def parse_time_range(time_range):
         print(f"Error parsing time range '{time_range}': {e}")
         return None, None
 
+@lru_cache(maxsize=2048)
 def time_to_minutes(time_str):
     """Convert time string in 24hr format (HH:MM) to minutes since midnight"""
     if not time_str:
@@ -82,6 +115,19 @@ def minutes_to_time(minutes):
     mins = minutes % 60
     return f"{hours:02d}:{mins:02d}"
 
+# 12-hour labels for every minute of the day, so formatting a slot is a list index
+TIME_12HR_BY_MINUTE = [
+    f"{(minutes // 60) % 12 or 12}:{minutes % 60:02d} {'AM' if minutes < 720 else 'PM'}"
+    for minutes in range(24 * 60)
+]
+
+def format_minutes_12hr(minutes):
+    """Format minutes since midnight as 12hr time (H:MM AM/PM)"""
+    if 0 <= minutes < len(TIME_12HR_BY_MINUTE):
+        return TIME_12HR_BY_MINUTE[minutes]
+    return format_time_12hr(minutes_to_time(minutes))
+
+@lru_cache(maxsize=2048)
 def format_time_12hr(time_str):
     """Format time string from 24hr (HH:MM) to 12hr (H:MM AM/PM)"""
     if not time_str:
@@ -122,17 +168,7 @@ def calculate_shift_duration_hours(start_time, end_time):
 
 def parse_day_code(day_code):
     """Convert day code (U,M,T,W,R,F,S) to full day name"""
-    day_map = {
-        'U': 'Sunday',
-        'M': 'Monday',
-        'T': 'Tuesday',
-        'W': 'Wednesday',
-        'R': 'Thursday',
-        'F': 'Friday',
-        'S': 'Saturday'
-    }
-    
-    return day_map.get(day_code.upper(), None)
+    return DAY_CODES.get(day_code.upper(), None)
 
 def parse_unavailable_time(unavailable_str):
     """Parse unavailable time string like 'MWF 1pm - 2pm'"""
@@ -142,7 +178,7 @@ def parse_unavailable_time(unavailable_str):
     result = {}
     try:
         # extract day codes and time range
-        match = re.match(r'([UMTWRFS]+)\s+(.*)', unavailable_str)
+        match = UNAVAILABLE_RE.match(unavailable_str)
         if not match:
             return result
         
@@ -150,17 +186,54 @@ def parse_unavailable_time(unavailable_str):
         start_time, end_time = parse_time_range(time_range)
         
         if start_time and end_time:
-            for day_code in day_codes:
-                day_name = parse_day_code(day_code)
-                if day_name:
-                    if day_name not in result:
-                        result[day_name] = []
-                    result[day_name].append((start_time, end_time))
+            # the regex only matches day-code letters, so every translated byte is a day index
+            for day_index in day_codes.encode("ascii").translate(DAY_INDEX_TABLE):
+                day_name = DAY_NAMES[day_index]
+                if day_name not in result:
+                    result[day_name] = []
+                result[day_name].append((start_time, end_time))
     except Exception as e:
         print(f"Error parsing unavailable time '{unavailable_str}': {e}")
     
     return result
 
+def merge_time_ranges(time_ranges):
+    """Sort (start, end) 24hr time ranges and merge the ones that overlap"""
+    ranges = [(time_to_minutes(start), time_to_minutes(end), start, end) for start, end in time_ranges]
+    if any(start is None or end is None for start, end, _, _ in ranges):
+        # leave unparseable ranges as they were
+        return list(time_ranges)
+    
+    merged = []
+    for start_mins, end_mins, start, end in sorted(ranges):
+        # ranges that only touch stay separate, since they don't overlap a shift between them
+        if merged and start_mins < merged[-1][1]:
+            if end_mins > merged[-1][1]:
+                merged[-1][1] = end_mins
+                merged[-1][3] = end
+        else:
+            merged.append([start_mins, end_mins, start, end])
+    
+    return [(start, end) for _, _, start, end in merged]
+
+def parse_availability(availability_str):
+    """Parse availability like '12pm - 5pm, 6pm - 8pm' into a list of start/end dicts"""
+    if not availability_str or availability_str.lower() == 'na':
+        return []
+    
+    # find every time range in a single regex scan instead of splitting on commas
+    day_ranges = []
+    for start, end in TIME_RANGE_RE.findall(availability_str):
+        start_time = convert_time_to_24hr(start)
+        end_time = convert_time_to_24hr(end)
+        if start_time and end_time:
+            day_ranges.append({
+                "start": start_time,
+                "end": end_time
+            })
+    
+    return day_ranges
+
 # data handling functions
 def load_json_data(file_path, default=None):
     """Load JSON data from file, return default if file doesn't exist"""
@@ -171,18 +244,79 @@ def load_json_data(file_path, default=None):
         return default
     
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            # large files are parsed in place from the page cache instead of copied into memory
+            if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    try:
+                        return orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        pass
+                f.seek(0)
+            
+            data = f.read()
+        
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # json also accepts things orjson rejects, like NaN
+                pass
+        return json.loads(data)
     except Exception as e:
         print(f"Error loading JSON from {file_path}: {e}")
         return default
 
-def save_json_data(file_path, data):
-    """Save data to JSON file"""
+_LOAD_FAILED = object()
+
+@lru_cache(maxsize=64)
+def _cached_load(file_path, mtime, size):
+    """Parse a JSON file once per modification time and size"""
+    return load_json_data(file_path, _LOAD_FAILED)
+
+def load_json_data_cached(file_path, default=None):
+    """Load JSON data, reusing the parsed result until the file changes.
+    
+    The returned object is shared between callers, so copy it before mutating.
+    """
+    # size catches rewrites that land within the filesystem's mtime granularity
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return [] if default is None else default
+    
+    data = _cached_load(file_path, stat.st_mtime_ns, stat.st_size)
+    if data is _LOAD_FAILED:
+        return [] if default is None else default
+    return data
+
+def clear_json_cache():
+    """Forget every file parsed by load_json_data_cached"""
+    _cached_load.cache_clear()
+
+def save_json_data(file_path, data, pretty=False):
+    """Save data to JSON file, compact unless pretty is set for files people edit by hand"""
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+            except TypeError:
+                # values orjson can't encode still go through json below
+                payload = None
+        if payload is None:
+            if pretty:
+                payload = json.dumps(data, indent=2).encode()
+            else:
+                payload = json.dumps(data, separators=(',', ':')).encode()
+        
+        # write to a temp file and swap it in so a crash never leaves a half-written file
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
         return True
     except Exception as e:
         print(f"Error saving JSON to {file_path}: {e}")
@@ -211,8 +345,15 @@ def get_settings_path(base_dir):
     """Get the path to the user settings file"""
     return os.path.join(base_dir, "data", "settings.json")
 
-def import_workers_from_excel(file_path):
-    """Import workers from Excel file"""
+def import_workers_from_excel(file_path, existing_names=None):
+    """Import workers from Excel file, returning (workers, skipped duplicates)
+    
+    existing_names is a set of lowercase (first, last) name tuples; rows matching
+    one of them, or an earlier row in the same file, are skipped.
+    """
+    # pandas is only needed for Excel import/export, so load it on first use
+    import pandas as pd
+    
     try:
         df = pd.read_excel(file_path)
         
@@ -227,49 +368,57 @@ def import_workers_from_excel(file_path):
             if col not in df.columns:
                 raise ValueError(f"Required column '{col}' not found in Excel file")
         
+        # skip rows with empty first name or last name
+        df = df.dropna(subset=["First Name", "Last Name"])
+        
+        # drop duplicate names for the whole sheet at once instead of row by row
+        skipped = 0
+        if existing_names is not None:
+            name_keys = pd.MultiIndex.from_arrays([
+                df["First Name"].astype(str).str.lower(),
+                df["Last Name"].astype(str).str.lower()
+            ])
+            duplicates = name_keys.duplicated() | name_keys.isin(list(existing_names))
+            skipped = int(duplicates.sum())
+            df = df[~duplicates]
+        
+        # columns that hold unavailable times, found once for the whole sheet
+        unavailable_columns = [col for col in df.columns if "Day(s) & Time not Available" in col]
+        
+        # whole-column conversions, then one plain dict per row instead of a Series
+        work_study = df["Work Study"].astype(str).str.lower().isin(['y', 'yes', 'true', '1']).tolist()
+        emails = df["Email"].where(df["Email"].notna(), "").tolist()
+        records = df.to_dict('records')
+        
         # process each row
         workers = []
-        for _, row in df.iterrows():
-            # skip rows with empty first name or last name
-            if pd.isna(row["First Name"]) or pd.isna(row["Last Name"]):
-                continue
-                
+        for row, is_work_study, email in zip(records, work_study, emails):
             # process availability
             availability = {}
             for day in ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]:
                 time_range = row[day]
-                if pd.isna(time_range) or time_range.lower() == 'na':
-                    availability[day] = []
-                else:
-                    # split multiple time ranges if present
-                    ranges = [r.strip() for r in str(time_range).split(',')]
-                    day_ranges = []
-                    for r in ranges:
-                        start_time, end_time = parse_time_range(r)
-                        if start_time and end_time:
-                            day_ranges.append({
-                                "start": start_time,
-                                "end": end_time
-                            })
-                    availability[day] = day_ranges
+                availability[day] = [] if pd.isna(time_range) else parse_availability(str(time_range))
             
             # process unavailable times
             unavailable = {}
-            for col in df.columns:
-                if "Day(s) & Time not Available" in col and not pd.isna(row[col]):
+            for col in unavailable_columns:
+                if not pd.isna(row[col]):
                     unavail_dict = parse_unavailable_time(str(row[col]))
                     for day, times in unavail_dict.items():
                         if day not in unavailable:
                             unavailable[day] = []
                         unavailable[day].extend(times)
             
+            # several columns can cover the same day, so keep each day's ranges sorted and disjoint
+            unavailable = {day: merge_time_ranges(times) for day, times in unavailable.items()}
+            
             # create worker object
             worker = {
                 "id": f"{row['First Name'].lower()}_{row['Last Name'].lower()}_{len(workers)}",
                 "first_name": row["First Name"],
                 "last_name": row["Last Name"],
-                "email": row["Email"] if not pd.isna(row["Email"]) else "",
-                "work_study": str(row["Work Study"]).lower() in ['y', 'yes', 'true', '1'],
+                "email": email,
+                "work_study": is_work_study,
                 "availability": availability,
                 "unavailable": unavailable,
                 "weekly_hours": 0  # will be updated when scheduling
@@ -277,13 +426,15 @@ def import_workers_from_excel(file_path):
             
             workers.append(worker)
         
-        return workers
+        return workers, skipped
     except Exception as e:
         print(f"Error importing workers from Excel: {e}")
         raise
 
 def export_workers_to_excel(workers, file_path):
     """Export workers to Excel file"""
+    import pandas as pd
+    
     try:
         # create DataFrame
         data = []
@@ -330,40 +481,78 @@ def export_workers_to_excel(workers, file_path):
         print(f"Error exporting workers to Excel: {e}")
         return False
 
-def is_worker_available(worker, day, start_time, end_time):
-    """Check if a worker is available for a specific shift"""
-    # check if the day exists in availability
-    if day not in worker["availability"]:
+def _interval_index(intervals):
+    """Sort minute intervals by start and pair the starts with a running max of the ends.
+    
+    For any time t, the intervals starting at or before t are the first
+    bisect_right(starts, t) entries, and the matching max_ends entry is the
+    latest any of them ends.
+    """
+    intervals = sorted(intervals)
+    return [start for start, _ in intervals], list(accumulate((end for _, end in intervals), max))
+
+def availability_minutes(worker):
+    """Convert a worker's availability and unavailable times to minute intervals per day.
+    
+    Returns (available, unavailable), each a dict of day -> (starts, max_ends)
+    as built by _interval_index.
+    """
+    available = {}
+    for day, time_ranges in worker.get("availability", {}).items():
+        intervals = [
+            (time_to_minutes(time_range["start"]), time_to_minutes(time_range["end"]))
+            for time_range in time_ranges
+        ]
+        available[day] = _interval_index(
+            (start, end) for start, end in intervals if start is not None and end is not None
+        )
+    
+    unavailable = {}
+    for day, time_ranges in worker.get("unavailable", {}).items():
+        intervals = [(time_to_minutes(start), time_to_minutes(end)) for start, end in time_ranges]
+        unavailable[day] = _interval_index(
+            (start, end) for start, end in intervals if start is not None and end is not None
+        )
+    
+    return available, unavailable
+
+def is_available_in_minutes(available, unavailable, day, shift_start_mins, shift_end_mins):
+    """Check a shift in minutes against intervals from availability_minutes"""
+    # the shift must fall completely within one available range: of the ranges
+    # starting by the shift start, the latest ending one must reach the shift end
+    if day not in available:
         return False
+    starts, max_ends = available[day]
+    i = bisect_right(starts, shift_start_mins)
+    if i == 0 or max_ends[i - 1] < shift_end_mins:
+        return False
+    
+    # and must not overlap any unavailable time: of the ranges starting before
+    # the shift ends, none may end after the shift starts
+    if day in unavailable:
+        starts, max_ends = unavailable[day]
+        i = bisect_left(starts, shift_end_mins)
+        if i and max_ends[i - 1] > shift_start_mins:
+            return False
+    
+    return True
+
+def is_worker_available(worker, day, start_time, end_time):
+    """Check if a worker is available for a specific shift
+    
+    Uses the worker's "_avail_mins"/"_unavail_mins" intervals when they were
+    precomputed with availability_minutes, otherwise converts them here.
+    """
+    if "_avail_mins" in worker:
+        available, unavailable = worker["_avail_mins"], worker["_unavail_mins"]
+    else:
+        available, unavailable = availability_minutes(worker)
     
     # convert times to minutes for easier comparison
     shift_start_mins = time_to_minutes(start_time)
     shift_end_mins = time_to_minutes(end_time)
     
-    # check if worker has any availability for this day
-    if not worker["availability"][day]:
-        return False
-    
-    # check if the shift falls within any of the worker's available time ranges
-    for time_range in worker["availability"][day]:
-        avail_start_mins = time_to_minutes(time_range["start"])
-        avail_end_mins = time_to_minutes(time_range["end"])
-        
-        # if the shift is completely within the available range
-        if avail_start_mins <= shift_start_mins and shift_end_mins <= avail_end_mins:
-            # now check if the shift overlaps with any unavailable times
-            if day in worker.get("unavailable", {}):
-                for unavail_start, unavail_end in worker["unavailable"][day]:
-                    unavail_start_mins = time_to_minutes(unavail_start)
-                    unavail_end_mins = time_to_minutes(unavail_end)
-                    
-                    # check if there's any overlap with unavailable time
-                    if not (shift_end_mins <= unavail_start_mins or shift_start_mins >= unavail_end_mins):
-                        return False
-            
-            return True
-    
-    return False
+    return is_available_in_minutes(available, unavailable, day, shift_start_mins, shift_end_mins)
 
 def get_available_workers(workers, day, start_time, end_time, exclude_workers=None):
     """Get list of workers available for a specific shift"""
@@ -381,16 +570,28 @@ def get_available_workers(workers, day, start_time, end_time, exclude_workers=No
     
     return available_workers
 
-def backup_data(base_dir, backup_path):
-    """Backup all data to a specified location"""
+def backup_data(base_dir, backup_path, compress=False):
+    """Backup all data to a specified location
+    
+    The data files are small JSON, so they are stored uncompressed by default;
+    compress=True uses fast level-1 deflate for backups kept somewhere slow.
+    """
     try:
         # create backup directory if it doesn't exist
         os.makedirs(os.path.dirname(backup_path), exist_ok=True)
         
-        # copy data directory to backup location
+        # zip the contents of the data directory, keeping empty folders
         data_dir = os.path.join(base_dir, "data")
-        import shutil
-        shutil.make_archive(backup_path, 'zip', data_dir)
+        if compress:
+            options = {"compression": zipfile.ZIP_DEFLATED, "compresslevel": 1}
+        else:
+            options = {"compression": zipfile.ZIP_STORED}
+        
+        with zipfile.ZipFile(backup_path + ".zip", "w", **options) as zf:
+            for dirpath, dirnames, filenames in os.walk(data_dir):
+                for name in dirnames + filenames:
+                    path = os.path.join(dirpath, name)
+                    zf.write(path, os.path.relpath(path, data_dir))
         
         return True
     except Exception as e:
@@ -400,16 +601,32 @@ def backup_data(base_dir, backup_path):
 def restore_data(base_dir, backup_path):
     """Restore data from a backup"""
     try:
-        # extract backup to data directory
         data_dir = os.path.join(base_dir, "data")
-        import shutil
+        restore_dir = data_dir + ".restore"
+        
+        # extract next to the data directory first, so a bad archive leaves the current data alone
+        if os.path.exists(restore_dir):
+            shutil.rmtree(restore_dir)
+        with zipfile.ZipFile(backup_path) as zf:
+            zf.extractall(restore_dir)
         
-        # remove existing data directory
-        if os.path.exists(data_dir):
-            shutil.rmtree(data_dir)
+        # move the live data aside before swapping, so a locked file can't leave it half deleted
+        old_dir = data_dir + ".old"
+        if os.path.exists(old_dir):
+            shutil.rmtree(old_dir)
+        had_data = os.path.exists(data_dir)
+        if had_data:
+            os.replace(data_dir, old_dir)
+        try:
+            os.replace(restore_dir, data_dir)
+        except Exception:
+            if had_data:
+                os.replace(old_dir, data_dir)
+            raise
         
-        # extract backup
-        shutil.unpack_archive(backup_path, base_dir)
+        # the old data is only removed once the restored copy is in place
+        if had_data:
+            shutil.rmtree(old_dir, ignore_errors=True)
         
         return True
     except Exception as e: